@@ -0,0 +1,279 @@
+"""Breeding compatibility graph built from the egg groups."""
+from collections import deque
+from typing import Iterable
+
+from pokemon import Pokemon
+from request import PokeApi
+
+
+class BreedingGraph():
+    """Model which species are able to breed between them.
+
+    The graph is bipartite: species nodes are only linked to the egg
+    group nodes they belong to, and the egg groups work as hubs. So two
+    species are compatible when they share at least one egg group,
+    without storing an edge for every pair of species.
+
+    Attributes
+    ----------
+    species_groups: dict[str, set[str]]
+        The keys are the species' names and the values are the names
+        of their egg groups.
+    group_species: dict[str, set[str]]
+        The keys are the egg groups' names and the values are the names
+        of the species belonging to them.
+
+    Notes
+    -----
+    The species of the 'no-eggs' group (legendaries, babies...) can't
+    breed, so the group is never used as a link between species.
+
+    The 'ditto' group is special: its species breed with every species
+    able to breed, and not with each other. It is modelled with one more
+    hub that contains all those species. Ditto only knows Transform, so
+    it can't pass a move on: its hubs are used to get the compatible
+    species, but never to walk chains, reaches or components.
+
+    A 'hop' is one breeding, i.e. moving from one species to another
+    that shares an egg group with it. The gender isn't modelled, so the
+    genderless species (only compatible with Ditto in the games) appear
+    compatible with their whole egg group.
+    """
+
+    NO_EGGS: str = 'no-eggs'
+    DITTO: str = 'ditto'
+    # Hub of the species compatible with Ditto. It isn't a real group.
+    ANY_BREEDABLE: str = '*'
+
+    def __init__(self) -> None:
+        """Initialize an empty graph."""
+        self.species_groups: dict[str, set[str]] = {}
+        self.group_species: dict[str, set[str]] = {}
+        self._breedable: set[str]|None = None
+
+    def add_species(self, species_name: str, egg_groups: Iterable[str]) -> None:
+        """Add a species and link it to its egg groups.
+
+        Parameters
+        ----------
+        species_name: str
+            Name of the species (in english, as the API gives it).
+        egg_groups: Iterable[str]
+            Names of the egg groups the species belongs to.
+        """
+        self._breedable = None
+        groups: set[str] = self.species_groups.setdefault(species_name, set())
+        for group_name in egg_groups:
+            groups.add(group_name)
+            self.group_species.setdefault(group_name, set()).add(species_name)
+
+    def add_pokemon(self, pokemon: Pokemon) -> None:
+        """Add a pokemon using the 'egg_groups' field of the instance.
+
+        Parameters
+        ----------
+        pokemon: Pokemon
+            The instance of a pokemon with name and egg_groups.
+        """
+        self.add_species(pokemon.name, [egg_group['name'] for egg_group in pokemon.egg_groups])
+
+    @classmethod
+    def from_api(cls, api: PokeApi|None = None) -> 'BreedingGraph':
+        """Build the graph of the whole dex from the 'egg-group/'
+
+        endpoint. Only one request per egg group is needed.
+
+        Parameters
+        ----------
+        api: PokeApi|None, optional
+            Instance used to make the requests. A new one by default.
+
+        Returns
+        -------
+        BreedingGraph
+            The graph with every species and egg group.
+        """
+        api = api or PokeApi()
+        graph: BreedingGraph = cls()
+        for egg_group in api.list_egg_groups() or []:
+            group_name: str = egg_group['name']
+            for species in api.get_egg_group_members(group_name) or []:
+                graph.add_species(species['name'], [group_name])
+        return graph
+
+    def _check_species(self, species_name: str) -> None:
+        """Raise an error if the species isn't in the graph."""
+        if species_name not in self.species_groups:
+            raise AttributeError(f"The species '{species_name}' isn't in the breeding graph.")
+
+    def _breedable_species(self) -> set[str]:
+        """Return the species of any group other than 'no-eggs' and
+
+        'ditto', i.e. those able to breed with Ditto.
+        """
+        if self._breedable is None:
+            self._breedable = {
+                species_name for species_name, groups in self.species_groups.items()
+                if groups - {self.NO_EGGS, self.DITTO}}
+        return self._breedable
+
+    def _hubs(self, species_name: str) -> set[str]:
+        """Return the hubs which link the species with the species it
+
+        can breed with.
+        """
+        groups: set[str] = self.species_groups[species_name]
+        hubs: set[str] = groups - {self.NO_EGGS, self.DITTO}
+        if hubs and self.DITTO in self.group_species:
+            hubs.add(self.DITTO)
+        if self.DITTO in groups:
+            hubs.add(self.ANY_BREEDABLE)
+        return hubs
+
+    def _chain_hubs(self, species_name: str) -> set[str]:
+        """Return the hubs through which the species can pass a move,
+
+        i.e. its egg groups except 'no-eggs' and 'ditto'.
+        """
+        return self.species_groups[species_name] - {self.NO_EGGS, self.DITTO}
+
+    def _hub_members(self, hub_name: str) -> set[str]:
+        """Return the species reached through a hub."""
+        if hub_name == self.ANY_BREEDABLE:
+            return self._breedable_species()
+        return self.group_species[hub_name]
+
+    def compatible_species(self, species_name: str) -> set[str]:
+        """Get the species able to breed directly with the species.
+
+        Parameters
+        ----------
+        species_name: str
+            Name of the species to check.
+
+        Returns
+        -------
+        set[str]
+            Names of the species sharing an egg group with it, plus
+            Ditto (the species itself not included).
+        """
+        self._check_species(species_name)
+        compatible: set[str] = set()
+        for hub_name in self._hubs(species_name):
+            compatible |= self._hub_members(hub_name)
+        compatible.discard(species_name)
+        return compatible
+
+    def _bfs(self, start: str, max_hops: int|None = None, goal: str|None = None) -> dict[str, str|None]:
+        """Walk the graph in breadth from a species.
+
+        Every hub is expanded once at most, so the walk is linear in
+        the number of memberships. Ditto's hubs are never expanded,
+        since Ditto can't pass a move.
+
+        Parameters
+        ----------
+        start: str
+            Name of the species where the walk starts.
+        max_hops: int|None, optional
+            Stop after this number of breedings. No limit by default.
+        goal: str|None, optional
+            Stop as soon as this species is reached.
+
+        Returns
+        -------
+        dict[str, str|None]
+            The keys are the species reached and the values the species
+            from which they were reached (None for the start).
+        """
+        parents: dict[str, str|None] = {start: None}
+        visited_hubs: set[str] = set()
+        queue: deque[tuple[str, int]] = deque([(start, 0)])
+
+        while queue:
+            species_name, hops = queue.popleft()
+            if species_name == goal or (max_hops is not None and hops >= max_hops):
+                continue
+            for hub_name in self._chain_hubs(species_name) - visited_hubs:
+                visited_hubs.add(hub_name)
+                for neighbour in self._hub_members(hub_name):
+                    if neighbour not in parents:
+                        parents[neighbour] = species_name
+                        if neighbour == goal:
+                            return parents
+                        queue.append((neighbour, hops + 1))
+        return parents
+
+    def shortest_chain(self, species_from: str, species_to: str) -> list[str]|None:
+        """Get the shortest chain of breedings to pass a move from
+
+        a species to another.
+
+        Parameters
+        ----------
+        species_from: str
+            Name of the species that knows the move.
+        species_to: str
+            Name of the species which should learn the move.
+
+        Returns
+        -------
+        list[str]|None
+            Names of the species in the chain, both ends included. None
+            if there is no chain between them.
+        """
+        self._check_species(species_from)
+        self._check_species(species_to)
+        parents: dict[str, str|None] = self._bfs(species_from, goal=species_to)
+        if species_to not in parents:
+            return None
+
+        chain: list[str] = []
+        node: str|None = species_to
+        while node is not None:
+            chain.append(node)
+            node = parents[node]
+        return chain[::-1]
+
+    def reachable_species(self, species_name: str, max_hops: int) -> set[str]:
+        """Get all species reachable within a number of breedings.
+
+        Parameters
+        ----------
+        species_name: str
+            Name of the species where the breedings start.
+        max_hops: int
+            Maximum number of breedings.
+
+        Returns
+        -------
+        set[str]
+            Names of the species reached (the species itself not
+            included).
+        """
+        self._check_species(species_name)
+        reached: set[str] = set(self._bfs(species_name, max_hops=max_hops))
+        reached.discard(species_name)
+        return reached
+
+    def connected_components(self) -> list[set[str]]:
+        """Split the species in groups where any of them can pass a
+
+        move to any other.
+
+        Returns
+        -------
+        list[set[str]]
+            The components sorted from the biggest to the smallest.
+            The species unable to breed, and Ditto, are a component by
+            themselves.
+        """
+        components: list[set[str]] = []
+        seen: set[str] = set()
+        for species_name in self.species_groups:
+            if species_name in seen:
+                continue
+            component: set[str] = set(self._bfs(species_name))
+            seen |= component
+            components.append(component)
+        return sorted(components, key=len, reverse=True)
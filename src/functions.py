@@ -5,6 +5,7 @@ from typing import NoReturn, Any
 from pandas import DataFrame
 from requests.exceptions import JSONDecodeError # type: ignore
 
+from name_index import Entry, NameIndex
 from pokemon import Pokemon
 from request import PokeApi
 
@@ -71,6 +72,34 @@ def get_option_user() -> int:
             break
     return option
 
+def get_names_user(option_selected: int) -> dict[str, str]:
+    """Ask the user the names of the question selected.
+
+    The names can be written in any language, they are resolved with
+    the index of names. An empty answer keeps the default name.
+
+    Parameters
+    ----------
+    option_selected: int
+        Number of option selected. Only the questions 2 and 3 ask
+        names.
+
+    Returns
+    -------
+    names: dict[str, str]
+        The parameters of the question written by the user.
+    """
+    questions: dict[int, dict[str, str]] = {
+        2: {'id': 'Pokémon (Raichu por defecto): '},
+        3: {'type': 'Tipo (lucha por defecto): ', 'generation': 'Generación (1 por defecto): '}
+    }
+    names: dict[str, str] = {}
+    for parameter, question in questions.get(option_selected, {}).items():
+        answer: str = input(question).strip()
+        if answer:
+            names[parameter] = answer
+    return names
+
 def list_pokemons_contain_pattern(pokemons: list[dict[str, str]], 
                                   pattern: str, is_regex: bool = False) -> DataFrame:
     """Return a dataframe of pokemons that match the pattern.
@@ -125,7 +154,8 @@ def no_duplicates(pokemon_data_1: list[dict[str, Any]], pokemon_data_2: list[dic
     return df_merge
 
     
-def pokemon_match_patterns(pattern_1: str = 'at', regex_1: str = '^(?:(?!a).)*a(?:(?!a).)*a(?:(?!a).)*$') -> int:
+def pokemon_match_patterns(pattern_1: str = 'at', regex_1: str = '^(?:(?!a).)*a(?:(?!a).)*a(?:(?!a).)*$',
+                           limit: int = 898, api: PokeApi|None = None) -> int:
     """Resolve question 1 (read more in menu funtion).
     
     Parameters
@@ -135,6 +165,11 @@ def pokemon_match_patterns(pattern_1: str = 'at', regex_1: str = '^(?:(?!a).)*a(
     regex_1: str, optional
         Regex to find within names of pokemons. 
         The default search for pokemon with double 'a'.
+    limit: int, optional
+        Number of pokemons to check, whatever the backend. Default
+        value is 898.
+    api: PokeApi|None, optional
+        Backend used to make the requests. 'PokeApi' by default.
 
     Returns
     -------
@@ -153,7 +188,7 @@ def pokemon_match_patterns(pattern_1: str = 'at', regex_1: str = '^(?:(?!a).)*a(
     # '?:' in each group to indicate is non-capturing version of group
     # an thus avoid warning.
     try:
-        all_pokemons: list[dict[str, str]]|None= PokeApi(limit=898).get_all_pokemon()
+        all_pokemons: list[dict[str, str]]|None= (api or PokeApi()).get_all_pokemon(limit)
     except JSONDecodeError as jde:
         print(f'Ha surgido un error:\n{jde}')
     else:
@@ -173,7 +208,38 @@ def pokemon_match_patterns(pattern_1: str = 'at', regex_1: str = '^(?:(?!a).)*a(
         # print(f'Total: {total_pokemons_patterns}')
         return total_pokemons_patterns
 
-def pokemon_egg_group_species(id: int = 26) -> tuple[Pokemon, int]:
+def resolve_name(index: NameIndex, name: str|int, kind: str) -> Entry|None:
+    """Translate a name (or id) written by the user, in any language
+
+    and maybe misspelled, to the resource of the API. Nothing is
+    requested.
+
+    Parameters
+    ----------
+    index: NameIndex
+        Index with the names of the API.
+    name: str|int
+        Name or id written by the user.
+    kind: str
+        Kind of name: 'pokemon', 'type', 'egg_group' or 'generation'.
+
+    Returns
+    -------
+    Entry|None
+        The kind, id and canonical name. None if the name doesn't
+        exist, in that case the most similar names are shown.
+    """
+    entry: Entry|None = index.resolve(str(name), kind)
+    if entry is not None:
+        return entry
+
+    suggestions: list[str] = [canonical_name for _, _, canonical_name in index.suggest(str(name), kind, limit=3)]
+    print(f"Una disculpa. No se encontró '{name}'.", end=' ')
+    print(f"¿Quisiste decir: {', '.join(suggestions)}?" if suggestions else '')
+    return None
+
+def pokemon_egg_group_species(id: int|str = 26, api: PokeApi|None = None,
+                              index: NameIndex|None = None) -> tuple[Pokemon, int]|None:
     """Resolve question 2 (read more in menu funtion).
 
     Say the number of species belonging to the egg groups of the
@@ -181,25 +247,38 @@ def pokemon_egg_group_species(id: int = 26) -> tuple[Pokemon, int]:
 
     Parameters
     ----------
-    id: int, optional
+    id: int|str, optional
         Id of the pokemon to check all the species belonging to its egg
-        groups.
+        groups. With an index, it can be its name in any language.
         Set in Raichu's Id by default.
+    api: PokeApi|None, optional
+        Backend used to make the requests. 'PokeApi' by default.
+    index: NameIndex|None, optional
+        Whether given, the pokemon is checked before any request.
 
     Returns
     -------
-    tuple[Pokemon, int] 
+    tuple[Pokemon, int]|None
         A tuple with the egg group(s)'s name(s) and the number of
-        pokemons in both egg groups (witouth duplicates).
+        pokemons in both egg groups (witouth duplicates). None if the
+        pokemon doesn't exist in the index.
     """
+    api = api or PokeApi()
+    if index is not None:
+        pokemon_entry: Entry|None = resolve_name(index, id, 'pokemon')
+        if pokemon_entry is None:
+            return None
+        id = pokemon_entry[1]
     try:
-        pokemon: Pokemon = PokeApi().get_pokemon(id)
+        # Without an index, the name is given in the place of the id.
+        pokemon: Pokemon = (api.get_pokemon(id) if isinstance(id, int)  # type: ignore
+                            else api.get_pokemon(name=id))
     except AttributeError as atrribute_error:
         print(f'Ha surgido un error:\n{atrribute_error}')
     except JSONDecodeError as jde:
         print(f'Ha surgido un error:\n{jde}')
     else:
-        egg_groups_species = PokeApi().get_egg_group_species(pokemon)
+        egg_groups_species = api.get_egg_group_species(pokemon)
         # Pokemons with only one egg group.
         if len(egg_groups_species) == 1:  # type: ignore
             _ , egg_group_species = list(egg_groups_species.items())[0]  # type: ignore
@@ -211,7 +290,9 @@ def pokemon_egg_group_species(id: int = 26) -> tuple[Pokemon, int]:
         number_total_species: int = total_species['name'].count()
         return pokemon, number_total_species
 
-def max_min_weigth_pokemon_by_type_generation(type: str = 'fighting', generation: int = 1) -> list[float]:
+def max_min_weigth_pokemon_by_type_generation(type: str = 'fighting', generation: int|str = 1,
+                                              api: PokeApi|None = None,
+                                              index: NameIndex|None = None) -> list[float]|None:
     """Look for the highest and lowest weight within the pokémon
     
     according to a type of pokemon and a generation.
@@ -220,13 +301,21 @@ def max_min_weigth_pokemon_by_type_generation(type: str = 'fighting', generation
     ----------
     type: str, optional
         Type of pokemons of interest. Default value is 'fighting'.
-    generation: int, optional
+    generation: int|str, optional
         The generation to cross with 'type' param. Default value is 1.
+        With an index, it can be its name in any language.
+    api: PokeApi|None, optional
+        Backend used to make the requests. 'PokeApi' by default.
+    index: NameIndex|None, optional
+        Whether given, the type and the generation can be written in
+        any language (as 'lucha') and they are checked before any
+        request.
 
     Returns
     -------
-    list[float]
+    list[float]|None
         A list with the highest and lowest weight in the data get.
+        None if the type or the generation doesn't exist in the index.
     
     Notes
     -----
@@ -234,21 +323,25 @@ def max_min_weigth_pokemon_by_type_generation(type: str = 'fighting', generation
     the lowest one.
     """
     list_pokemon_weight: list[float] = []
+    if index is not None:
+        type_entry: Entry|None = resolve_name(index, type, 'type')
+        generation_entry: Entry|None = resolve_name(index, generation, 'generation')
+        if type_entry is None or generation_entry is None:
+            return None
+        type, generation = type_entry[2], generation_entry[1]
     try:
-        pokemon_type: dict[str, list] = PokeApi().list_pokemon_by_type(type)
-        pokemon_generacion: dict[str, list] = PokeApi().list_pokemon_generation(generation)
+        # The backend decides how to cross the type and the generation.
+        pokemons: list[Pokemon]|None = (api or PokeApi()).list_pokemon_type_generation(type, int(generation))
     except AttributeError as atrribute_error:
         print(f'Ha surgido un error:\n{atrribute_error}')
     except JSONDecodeError as jde:
         print(f'Ha surgido un error:\n{jde}')
     else:
-        list_pokemon_type: list[dict[str, str]] = list(pokemon_type.values())[0]
-        list_pokemon_generacion: list[dict[str, str]] = list(pokemon_generacion.values())[0]
-        pokemon_type_generation: DataFrame = no_duplicates(
-                                                list_pokemon_type, list_pokemon_generacion, type_join='inner')
+        if pokemons is None:
+            return None
+        pokemon_type_generation: DataFrame = DataFrame([pokemon.name for pokemon in pokemons], columns=['name'])
         # Get the weight of each pokemon
-        for pokemon_name in pokemon_type_generation['name']:
-            pokemon: Pokemon = PokeApi().get_pokemon(pokemon_name)
+        for pokemon in pokemons:
             pokemon_weight: float = float(str(round(pokemon.weight, 2)))
             list_pokemon_weight.append(pokemon_weight)
         
@@ -258,7 +351,8 @@ def max_min_weigth_pokemon_by_type_generation(type: str = 'fighting', generation
         # print(pokemon_type_generation)
         return [max_weight, min_weight]
         
-def print_option(option_selected: int, pokemon_name: str = 'raichu') -> None:
+def print_option(option_selected: int, pokemon_name: str = 'raichu', type: str = 'lucha',
+                 generation: int|str = 1) -> None:
     """Shows the option selected by the user.
 
     Generally called along with your answer.
@@ -269,8 +363,13 @@ def print_option(option_selected: int, pokemon_name: str = 'raichu') -> None:
         Number of option selected.
     pokemon_name: str, optional
         Name of pokemon to show in second question.
+    type: str, optional
+        Type of pokemon to show in third question.
+    generation: int|str, optional
+        Generation of pokemon to show in third question.
     """
-    print(f'{option_selected}. {spanish_options(pokemon_name)[option_selected][:-1]} = ', end='')
+    options: dict[int, str] = spanish_options(pokemon_name, type, generation)  # type: ignore
+    print(f'{option_selected}. {options[option_selected][:-1]} = ', end='')
 
 
 def notes(number_question: int, **kwargs: int) -> None:
@@ -20,33 +20,67 @@ The format of docstrings is NumPy/SciPy, following PEP 257.
 The API used is 'PokeAPI' (https://pokeapi.co/). Just accept HTTP GET
 requests and not need authentication.
 """
-from typing import NoReturn, Callable
+from functools import partial
+from os.path import exists
+from sys import argv
+from typing import Any, Callable
 
-from functions import (menu, get_option_user, print_option, notes, pokemon_match_patterns,
+from functions import (menu, get_option_user, get_names_user, print_option, notes, pokemon_match_patterns,
                         pokemon_egg_group_species, max_min_weigth_pokemon_by_type_generation, exit)
+from name_index import NameIndex
+from prefetch import PrefetchPokeApi
 
-def main() -> None:
-    """Call menu and resolve the question."""
-    resolve: dict[int, Callable[[], int|list[float]|NoReturn]] = {
-        1: pokemon_match_patterns,
-        2: pokemon_egg_group_species,
-        3: max_min_weigth_pokemon_by_type_generation,
+def main(prefetch: bool = False, names_path: str = 'pokeapi_names.json.gz') -> None:
+    """Call menu and resolve the question.
+
+    Parameters
+    ----------
+    prefetch: bool, optional
+        Whether to fetch the data of the questions in background while
+        the menu waits the user.
+    names_path: str, optional
+        Index of names built with 'name_index.py'. If it exists, the
+        user writes the pokemon, the type and the generation of the
+        questions in any language, and they are resolved without any
+        request.
+    """
+    api: PrefetchPokeApi|None = PrefetchPokeApi(limit=898) if prefetch else None
+    index: NameIndex|None = NameIndex.load(names_path) if exists(names_path) else None
+    resolve: dict[int, Callable[..., Any]] = {
+        1: partial(pokemon_match_patterns, api=api),
+        2: partial(pokemon_egg_group_species, api=api, index=index),
+        3: partial(max_min_weigth_pokemon_by_type_generation, api=api, index=index),
         4: exit
     }
 
     while True:
         menu()
-        result: int|list[float] = 0
+        if api is not None:
+            api.warm_up()
+        result: int|list[float]|None = 0
         option_selected: int = get_option_user()
+        if api is not None and option_selected == 4:
+            api.cancel()
+        names: dict[str, str] = get_names_user(option_selected) if index is not None else {}
         if option_selected == 2:
-            pokemon, result = resolve[option_selected]()  # type: ignore
-            notes(option_selected, pokemon=pokemon)  # type: ignore
-            print_option(option_selected, pokemon_name=pokemon.name) # type: ignore
+            answer = resolve[option_selected](**names)
+            if answer is None:
+                result = None
+            else:
+                pokemon, result = answer  # type: ignore
+                notes(option_selected, pokemon=pokemon)  # type: ignore
+                print_option(option_selected, pokemon_name=pokemon.name) # type: ignore
+        elif option_selected == 3:
+            result = resolve[option_selected](**names)
+            if result is not None:
+                notes(option_selected)
+                print_option(option_selected, type=names.get('type', 'lucha'), generation=names.get('generation', 1))
         else:
             result = resolve[option_selected]()
             notes(option_selected)
             print_option(option_selected)
-        print(result)
+        if result is not None:
+            print(result)
         
         to_continue: str = input(
             "\n¿Desea resolver alguna otra pokéduda? Sí (presione 's') o cualquier otra tecla para salir: "
@@ -54,7 +88,9 @@ def main() -> None:
         if to_continue == 's':
             continue
         else:
+            if api is not None:
+                api.cancel()
             exit()
 
 if __name__ == '__main__':
-    main()
+    main(prefetch='--prefetch' in argv)
@@ -0,0 +1,243 @@
+"""Index to resolve the names written by the user without requests."""
+import gzip
+import json
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable
+
+from request import PokeApi
+
+# (kind, id, canonical name), e.g. ('type', 2, 'fighting').
+Entry = tuple[str, int, str]
+
+
+def normalize(name: str) -> str:
+    """Lowercase the name and remove its accents and separators, so
+
+    'Lucha', 'lúcha' and 'LUCHA' are the same.
+
+    Only the accents of the latin letters are removed, the marks of
+    other scripts change the letter (e.g. 'ガ' isn't 'カ').
+    """
+    decomposed: str = unicodedata.normalize('NFKD', name.casefold())
+    kept: list[str] = []
+    for char in decomposed:
+        if unicodedata.combining(char) and kept and unicodedata.name(kept[-1], '').startswith('LATIN'):
+            continue
+        kept.append(char)
+    composed: str = unicodedata.normalize('NFC', ''.join(kept))
+    return ' '.join(composed.replace('-', ' ').replace('_', ' ').split())
+
+
+def trigrams(name: str) -> set[str]:
+    """Split a normalized name in groups of three characters."""
+    padded: str = f'  {name} '
+    return {padded[index:index + 3] for index in range(len(padded) - 2)}
+
+
+def edit_distance(name_1: str, name_2: str) -> int:
+    """Count the insertions, deletions and substitutions needed to
+
+    turn a name into the other (Levenshtein distance).
+    """
+    previous: list[int] = list(range(len(name_2) + 1))
+    for index_1, char_1 in enumerate(name_1, start=1):
+        current: list[int] = [index_1]
+        for index_2, char_2 in enumerate(name_2, start=1):
+            current.append(min(previous[index_2] + 1, current[index_2 - 1] + 1,
+                               previous[index_2 - 1] + (char_1 != char_2)))
+        previous = current
+    return previous[-1]
+
+
+class NameIndex():
+    """Resolve the names of pokemons, types, egg groups and generations,
+
+    in every language given by the API, to their canonical id and name.
+
+    The exact names are found with only a lookup, and the misspelled
+    ones get suggestions ranked through a trigram index.
+
+    Attributes
+    ----------
+    KINDS: dict[str, str]
+        The kinds of names indexed and their endpoints.
+
+    Notes
+    -----
+    Building the index from the API needs one request per resource (more
+    than a thousand for the pokemons), so it is meant to be built once
+    and saved with 'save'.
+    """
+
+    KINDS: dict[str, str] = {
+        'pokemon': 'pokemon-species/',
+        'type': 'type/',
+        'egg_group': 'egg-group/',
+        'generation': 'generation/'}
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._entries: dict[str, set[Entry]] = {}
+        # One trigram map per kind, so a kind never hides the others.
+        self._trigrams: dict[str, dict[str, set[str]]] = {}
+
+    def add(self, kind: str, id: int, canonical_name: str, names: Iterable[str] = ()) -> None:
+        """Add a resource with all its names.
+
+        Parameters
+        ----------
+        kind: str
+            One of the keys of 'KINDS'.
+        id: int
+            Id of the resource in the API.
+        canonical_name: str
+            Name of the resource in the API (in english).
+        names: Iterable[str], optional
+            Names of the resource in other languages.
+        """
+        entry: Entry = (kind, id, canonical_name)
+        kind_trigrams: dict[str, set[str]] = self._trigrams.setdefault(kind, {})
+        for name in [canonical_name, *names]:
+            normalized_name: str = normalize(name)
+            for trigram in trigrams(normalized_name):
+                kind_trigrams.setdefault(trigram, set()).add(normalized_name)
+            self._entries.setdefault(normalized_name, set()).add(entry)
+
+    def resolve(self, name: str, kind: str|None = None) -> Entry|None:
+        """Get the resource with exactly that name.
+
+        Parameters
+        ----------
+        name: str
+            Name in any language. Case and accents are ignored.
+        kind: str|None, optional
+            Only look for this kind of resource.
+
+        Returns
+        -------
+        Entry|None
+            The kind, id and canonical name. None if there isn't any.
+        """
+        entries: list[Entry] = sorted(
+            entry for entry in self._entries.get(normalize(name), set()) if kind is None or entry[0] == kind)
+        return entries[0] if entries else None
+
+    def suggest(self, name: str, kind: str|None = None, limit: int = 5) -> list[Entry]:
+        """Get the resources with the most similar names.
+
+        Parameters
+        ----------
+        name: str
+            Name, maybe misspelled, in any language.
+        kind: str|None, optional
+            Only look for this kind of resource.
+        limit: int, optional
+            Maximum number of suggestions.
+
+        Returns
+        -------
+        list[Entry]
+            The suggestions, from the most similar to the least.
+        """
+        normalized_name: str = normalize(name)
+        shared: dict[tuple[str, str], int] = {}
+        for candidate_kind in [kind] if kind else list(self._trigrams):
+            kind_trigrams: dict[str, set[str]] = self._trigrams.get(candidate_kind, {})
+            for trigram in trigrams(normalized_name):
+                for candidate in kind_trigrams.get(trigram, ()):
+                    shared[candidate_kind, candidate] = shared.get((candidate_kind, candidate), 0) + 1
+
+        # Only the names sharing more trigrams are compared in detail.
+        candidates: list[tuple[str, str]] = sorted(shared, key=lambda candidate: -shared[candidate])[:limit * 10]
+        ranked: list[tuple[int, int, Entry]] = []
+        for candidate_kind, candidate in candidates:
+            distance: int = edit_distance(normalized_name, candidate)
+            for entry in self._entries[candidate]:
+                if entry[0] == candidate_kind:
+                    ranked.append((distance, -shared[candidate_kind, candidate], entry))
+
+        suggestions: list[Entry] = []
+        for _, _, entry in sorted(ranked):
+            if entry not in suggestions:
+                suggestions.append(entry)
+        return suggestions[:limit]
+
+    @classmethod
+    def from_api(cls, api: PokeApi|None = None, max_workers: int = 8) -> 'NameIndex':
+        """Build the index with the names of every resource in the API.
+
+        Parameters
+        ----------
+        api: PokeApi|None, optional
+            Instance used to make the requests. A new one by default.
+        max_workers: int, optional
+            Number of requests made at the same time.
+
+        Returns
+        -------
+        NameIndex
+            The index with every name.
+        """
+        api = api or PokeApi()
+        index: NameIndex = cls()
+        resources: list[tuple[str, dict[str, str]]] = [
+            (kind, resource)
+            for kind, endpoint_url in cls.KINDS.items()
+            for resource in api.list_resources(endpoint_url) or []]
+
+        def names(kind_resource: tuple[str, dict[str, str]]) -> list[str]:
+            kind, resource = kind_resource
+            languages_names = api.get_names(cls.KINDS[kind], resource['name']) or []  # type: ignore
+            return [language_name['name'] for language_name in languages_names]
+
+        with ThreadPoolExecutor(max_workers) as executor:
+            for (kind, resource), resource_names in zip(resources, executor.map(names, resources)):
+                id: int = int(resource['url'].rstrip('/').split('/')[-1])
+                # The pokemons and the generations are also known by their number.
+                if kind in ('pokemon', 'generation'):
+                    resource_names.append(str(id))
+                index.add(kind, id, resource['name'], resource_names)
+        return index
+
+    def save(self, path: str) -> None:
+        """Write the index in a gzipped JSON file.
+
+        Parameters
+        ----------
+        path: str
+            Path of the file.
+        """
+        names_by_entry: dict[Entry, list[str]] = {}
+        for name, entries in self._entries.items():
+            for entry in entries:
+                names_by_entry.setdefault(entry, []).append(name)
+        content: list[list] = [[*entry, names] for entry, names in names_by_entry.items()]
+        with gzip.open(path, 'wt', encoding='utf-8') as index_file:
+            json.dump(content, index_file, ensure_ascii=False, separators=(',', ':'))
+
+    @classmethod
+    def load(cls, path: str) -> 'NameIndex':
+        """Read an index saved with 'save'.
+
+        Parameters
+        ----------
+        path: str
+            Path of the file.
+
+        Returns
+        -------
+        NameIndex
+            The index with every name of the file.
+        """
+        index: NameIndex = cls()
+        with gzip.open(path, 'rt', encoding='utf-8') as index_file:
+            for kind, id, canonical_name, names in json.load(index_file):
+                index.add(kind, id, canonical_name, names)
+        return index
+
+
+if __name__ == '__main__':
+    # Build the index once: python src/name_index.py pokeapi_names.json.gz
+    from sys import argv
+    NameIndex.from_api().save(argv[1] if len(argv) > 1 else 'pokeapi_names.json.gz')
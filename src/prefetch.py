@@ -0,0 +1,132 @@
+"""Backend that prefetches the data of the questions in background."""
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from threading import Event, Lock, local
+from typing import Any, Callable
+
+import requests
+
+from request import PokeApi
+from transport import Transport
+
+
+class PrefetchPokeApi(PokeApi):
+    """Request to the PokeApi sharing every response between threads,
+
+    so the data can be fetched in background while the menu waits the
+    user, and the question selected reuses the requests already done or
+    still in flight.
+
+    Attributes
+    ----------
+    base_url: str
+        The base URL of the PokeAPI.
+    limit: int
+        Indicate the number of resources to get by page.
+
+    Notes
+    -----
+    The prefetch is kept at low priority with few workers, and it can be
+    cancelled at any moment: the pending tasks are discarded and the
+    running ones stop before their next request.
+    """
+
+    def __init__(self, base_url: str = 'https://pokeapi.co/api/v2/', max_workers: int = 2,
+                 transport: Transport|None = None, **kwargs: int) -> None:
+        """Initialize the attributes.
+
+        Parameters
+        ----------
+        base_url: str, optional
+            The base URL of the PokeAPI.
+        max_workers: int, optional
+            Number of threads used to prefetch.
+        transport: Transport|None, optional
+            Who sends the requests. 'RequestsTransport' by default.
+        kwargs: dict
+            Other parameters to create a request.
+        """
+        super().__init__(base_url, transport, **kwargs)
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers, thread_name_prefix='prefetch')
+        self._responses: dict[str, Future] = {}
+        self._lock: Lock = Lock()
+        self._cancelled: Event = Event()
+        self._thread: local = local()
+
+    def get(self, endpoint_url: str, **kwargs: Any) -> requests.Response:
+        """Get data from and specific endpoint, only once.
+
+        If the same request was already done, or is being done by other
+        thread, its response is reused.
+
+        Raises
+        ------
+        CancelledError
+            If it is called from a prefetch task after the cancellation.
+        """
+        if getattr(self._thread, 'background', False) and self._cancelled.is_set():
+            raise CancelledError('The prefetch was cancelled.')
+
+        params: dict[str, Any] = kwargs.get('params') or {}
+        key: str = f'{endpoint_url}?{sorted(params.items())}'
+        with self._lock:
+            future: Future|None = self._responses.get(key)
+            is_owner: bool = future is None
+            if future is None:
+                future = self._responses[key] = Future()
+
+        if is_owner:
+            try:
+                future.set_result(super().get(endpoint_url, **kwargs))
+            except Exception as exception:
+                # Failed requests aren't kept, so they can be retried.
+                with self._lock:
+                    del self._responses[key]
+                future.set_exception(exception)
+        return future.result()
+
+    def _run_in_background(self, task: Callable[[], Any]) -> None:
+        """Run a prefetch task, ignoring its result and its errors."""
+        self._thread.background = True
+        try:
+            task()
+        except Exception:
+            # The question will repeat the request and show the error.
+            pass
+
+    def prefetch(self, task: Callable[[], Any]) -> Future|None:
+        """Send a task to run in background.
+
+        Parameters
+        ----------
+        task: Callable[[], Any]
+            Function which makes the requests to warm.
+
+        Returns
+        -------
+        Future|None
+            The future of the task. None if the prefetch is cancelled.
+        """
+        if self._cancelled.is_set():
+            return None
+        return self._executor.submit(self._run_in_background, task)
+
+    def warm_up(self, pokemon_id: int = 26, type: str = 'fighting', generation_number: int = 1) -> None:
+        """Prefetch the data every question of the menu needs.
+
+        Parameters
+        ----------
+        pokemon_id: int, optional
+            Pokemon of the question 2. Raichu's Id by default.
+        type: str, optional
+            Type of the question 3. 'fighting' by default.
+        generation_number: int, optional
+            Generation of the question 3. 1 by default.
+        """
+        self.prefetch(self.get_all_pokemon)
+        self.prefetch(lambda: self.get_egg_group_species(self.get_pokemon(pokemon_id)))  # type: ignore
+        self.prefetch(lambda: self.list_pokemon_type_generation(type, generation_number))
+
+    def cancel(self) -> None:
+        """Stop the prefetch. The requests already done are kept."""
+        self._cancelled.set()
+        self._executor.shutdown(wait=False, cancel_futures=True)
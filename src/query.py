@@ -0,0 +1,351 @@
+"""Query layer to filter pokemons planning the cheapest requests."""
+import re
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy
+from typing import Any, Callable
+
+from pandas import DataFrame
+
+from name_index import NameIndex
+from request import PokeApi
+from transport import CountingTransport
+
+
+class Query():
+    """Filter the pokemons by any combination of type, generation, egg
+    group and name pattern, getting only the attributes needed.
+
+    The execution is planned to make the fewest requests and round
+    trips. The membership lists are used from the smallest estimated to
+    the biggest, and the name pattern is checked locally. The lists are
+    either fetched one by one, skipping the rest as soon as no candidate
+    is left, or at the same time when the estimates say few lists would
+    be skipped. The details are only fetched (in batch) for the pokemons
+    that pass every filter.
+
+    Attributes
+    ----------
+    type: str
+        Name of type of the pokemons, in english.
+    generation: int
+        Number of generation of the pokemons.
+    egg_group: str
+        Name of egg group of the pokemons, in english.
+    pattern: str
+        Pattern to find within names.
+    is_regex: bool
+        Whether the pattern is a regex.
+    attributes: tuple[str, ...]
+        Attributes to get: 'weight' and/or 'height' of every pokemon,
+        and/or the 'count' of pokemons, which never needs extra
+        requests.
+    count: int|None
+        Number of pokemons that match the filters, when 'count' is
+        asked. None until run.
+
+    Notes
+    -----
+    The type lists the pokemons' names while the generation and the egg
+    group list the species' names. Both are the same for the default
+    forms.
+    """
+
+    # Approximated size of every list, used to estimate the plan.
+    ESTIMATED_TYPE_SIZE: dict[str, int] = {
+        'normal': 150, 'fighting': 95, 'flying': 150, 'poison': 100, 'ground': 95, 'rock': 90, 'bug': 100,
+        'ghost': 80, 'steel': 85, 'fire': 95, 'water': 175, 'grass': 140, 'electric': 90, 'psychic': 125,
+        'ice': 55, 'dragon': 80, 'dark': 85, 'fairy': 75}
+    ESTIMATED_GENERATION_SIZE: dict[int, int] = {1: 151, 2: 100, 3: 135, 4: 107, 5: 156, 6: 72, 7: 88, 8: 96, 9: 120}
+    ESTIMATED_EGG_GROUP_SIZE: dict[str, int] = {
+        'monster': 80, 'water1': 120, 'bug': 85, 'flying': 110, 'ground': 300, 'fairy': 110, 'plant': 80,
+        'humanshape': 100, 'water3': 40, 'mineral': 85, 'indeterminate': 100, 'water2': 35, 'ditto': 1,
+        'dragon': 90, 'no-eggs': 150}
+    ESTIMATED_DEFAULT_SIZE: int = 100
+    ESTIMATED_PATTERN_SELECTIVITY: float = 0.1
+    # Every pokemon, forms included.
+    ALL_POKEMON: int = 1302
+    # Cost of waiting one more round trip, measured in requests.
+    ROUND_TRIP_COST: float = 1.0
+    DETAILS: tuple[str, ...] = ('weight', 'height')
+    ATTRIBUTES: tuple[str, ...] = DETAILS + ('count',)
+    TOGETHER: str = 'together'
+    ONE_BY_ONE: str = 'one by one'
+
+    def __init__(self, type: str = '', generation: int|str = 0, egg_group: str = '', pattern: str = '',
+                 is_regex: bool = False, attributes: tuple[str, ...] = (), api: PokeApi|None = None,
+                 max_workers: int = 8, index: NameIndex|None = None) -> None:
+        """Initialize the filters of the query.
+
+        Parameters
+        ----------
+        type: str, optional
+        generation: int|str, optional
+            Its name is only accepted with an index.
+        egg_group: str, optional
+        pattern: str, optional
+        is_regex: bool, optional
+        attributes: tuple[str, ...], optional
+
+        Other Parameters
+        ----------------
+        api: PokeApi|None
+            Backend used to make the requests. 'PokeApi' by default.
+        max_workers: int
+            Number of requests made at the same time.
+        index: NameIndex|None
+            Whether given, the type, the generation and the egg group
+            can be written in any language, and they are checked before
+            any request.
+
+        Raises
+        ------
+        AttributeError
+            If an attribute isn't supported or a name isn't in the index.
+        """
+        unknown: set[str] = set(attributes) - set(self.ATTRIBUTES)
+        if unknown:
+            raise AttributeError(f"The attributes {sorted(unknown)} aren't supported.")
+
+        if index is not None:
+            type = self._resolve(index, type, 'type')[2] if type else type
+            generation = self._resolve(index, generation, 'generation')[1] if generation else generation
+            egg_group = self._resolve(index, egg_group, 'egg_group')[2] if egg_group else egg_group
+
+        self.type: str = type
+        self.generation: int = int(generation)
+        self.egg_group: str = egg_group
+        self.pattern: str = pattern
+        self.is_regex: bool = is_regex
+        self.attributes: tuple[str, ...] = attributes
+        self.api: PokeApi = api or PokeApi()
+        self.max_workers: int = max_workers
+        self.steps: list[dict[str, Any]] = []
+        self.count: int|None = None
+
+    @staticmethod
+    def _resolve(index: NameIndex, name: str|int, kind: str) -> tuple[str, int, str]:
+        """Get the resource of a name from the index.
+
+        Raises
+        ------
+        AttributeError
+            If the name isn't in the index, with the similar ones.
+        """
+        entry = index.resolve(str(name), kind)
+        if entry is None:
+            suggestions: list[str] = [canonical_name for _, _, canonical_name in index.suggest(str(name), kind, 3)]
+            raise AttributeError(f"The {kind} '{name}' doesn't exist. Similar names: {suggestions}.")
+        return entry
+
+    def _membership_lists(self) -> list[tuple[str, int, Callable[[PokeApi], list[dict[str, str]]|None]]]:
+        """Return the lists to fetch, with their estimated size and the
+
+        function to fetch them. When there is only the name pattern, all
+        pokemons are listed.
+        """
+        lists: list[tuple[str, int, Callable[[PokeApi], list[dict[str, str]]|None]]] = []
+        if self.type:
+            lists.append((
+                f"type '{self.type}'",
+                self.ESTIMATED_TYPE_SIZE.get(self.type, self.ESTIMATED_DEFAULT_SIZE),
+                lambda api: self._values(api.list_pokemon_by_type(self.type))))
+        if self.generation:
+            lists.append((
+                f'generation {self.generation}',
+                self.ESTIMATED_GENERATION_SIZE.get(self.generation, self.ESTIMATED_DEFAULT_SIZE),
+                lambda api: self._values(api.list_pokemon_generation(self.generation))))
+        if self.egg_group:
+            lists.append((
+                f"egg group '{self.egg_group}'",
+                self.ESTIMATED_EGG_GROUP_SIZE.get(self.egg_group, self.ESTIMATED_DEFAULT_SIZE),
+                lambda api: api.get_egg_group_members(self.egg_group)))
+        if not lists:
+            lists.append(('all pokemons', self.ALL_POKEMON, lambda api: api.get_all_pokemon(self.ALL_POKEMON)))
+        return lists
+
+    @staticmethod
+    def _values(list_by_name: dict[str, list]|None) -> list[dict[str, str]]|None:
+        """Return the list of a dict with only one key."""
+        return list(list_by_name.values())[0] if list_by_name else None
+
+    def _matches(self, name: str) -> bool:
+        """Check if the name contains the pattern."""
+        if self.is_regex:
+            return re.search(self.pattern, name) is not None
+        return self.pattern in name
+
+    def _estimated_candidates(self, sizes: list[int]) -> list[float]:
+        """Estimate how many pokemons are left after each list, from
+
+        the smallest, supposing the lists are independent. The name
+        pattern is applied to the first list.
+        """
+        candidates: float = sizes[0] * (self.ESTIMATED_PATTERN_SELECTIVITY if self.pattern else 1)
+        estimated: list[float] = [candidates]
+        for size in sizes[1:]:
+            candidates *= size / self.ALL_POKEMON
+            estimated.append(candidates)
+        return estimated
+
+    def _strategy(self) -> tuple[str, float, float]:
+        """Choose how to fetch the membership lists.
+
+        Fetching them one by one costs a round trip per list, but the
+        rest are skipped when no candidate is left; the chance of a
+        next list is estimated as the candidates left (up to 1).
+        Fetching them at the same time costs every list and one round
+        trip.
+
+        Returns
+        -------
+        tuple[str, float, float]
+            The strategy chosen, and the estimated cost of fetching the
+            lists at the same time and one by one.
+        """
+        sizes: list[int] = sorted(size for _, size, _ in self._membership_lists())
+        estimated: list[float] = self._estimated_candidates(sizes)
+        one_by_one_requests: float = 1 + sum(min(1.0, candidates) for candidates in estimated[:-1])
+        one_by_one: float = one_by_one_requests * (1 + self.ROUND_TRIP_COST)
+        together: float = len(sizes) + self.ROUND_TRIP_COST
+        strategy: str = self.TOGETHER if len(sizes) > 1 and together < one_by_one else self.ONE_BY_ONE
+        return strategy, together, one_by_one
+
+    def plan(self) -> list[dict[str, Any]]:
+        """Plan the steps of the query with their estimated requests.
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            Every step with its 'step' description, its 'estimated'
+            number of requests and its 'actual' one (None until run).
+        """
+        lists = sorted(self._membership_lists(), key=lambda membership: membership[1])
+        estimated: list[float] = self._estimated_candidates([size for _, size, _ in lists])
+        steps: list[dict[str, Any]] = []
+        if self._strategy()[0] == self.TOGETHER:
+            described: str = ', '.join(f'{label} (~{size})' for label, size, _ in lists)
+            steps.append({'step': f'fetch at the same time {described}', 'estimated': len(lists), 'actual': None})
+            steps.append({'step': 'intersect from the smallest list', 'estimated': 0, 'actual': None})
+            if self.pattern:
+                steps.append({'step': f"filter name '{self.pattern}' locally", 'estimated': 0, 'actual': None})
+        else:
+            label, size, _ = lists[0]
+            steps.append({'step': f'fetch {label} (~{size})', 'estimated': 1, 'actual': None})
+            if self.pattern:
+                steps.append({'step': f"filter name '{self.pattern}' locally", 'estimated': 0, 'actual': None})
+            for (label, size, _), candidates in zip(lists[1:], estimated):
+                steps.append({
+                    'step': f'fetch {label} (~{size}) and intersect, unless no candidate is left',
+                    'estimated': round(min(1.0, candidates), 2),
+                    'actual': None})
+        if 'count' in self.attributes:
+            steps.append({'step': 'count candidates locally', 'estimated': 0, 'actual': None})
+        details: list[str] = [attribute for attribute in self.attributes if attribute in self.DETAILS]
+        if details:
+            steps.append({
+                'step': f"fetch {', '.join(details)} of candidates",
+                'estimated': round(estimated[-1]),
+                'actual': None})
+        return steps
+
+    def run(self) -> DataFrame:
+        """Execute the plan.
+
+        Returns
+        -------
+        DataFrame
+            The name of every pokemon that matches the filters, along
+            with the weight and height asked. The count is kept in
+            'count'.
+
+        Notes
+        -----
+        The requests are counted with a copy of the backend, so the
+        backend can be shared and the requests answered without any
+        connection (as the cached ones) aren't counted.
+        """
+        self.steps = self.plan()
+        steps = iter(self.steps)
+        counter: CountingTransport = CountingTransport(self.api.transport)
+        api: PokeApi = copy(self.api)
+        api.transport = counter
+        lists = sorted(self._membership_lists(), key=lambda membership: membership[1])
+
+        with ThreadPoolExecutor(self.max_workers) as executor:
+            step: dict[str, Any] = next(steps)
+            names: list[str]
+            if self._strategy()[0] == self.TOGETHER:
+                memberships: list[list[dict[str, str]]] = [
+                    membership or [] for membership in executor.map(lambda membership: membership[2](api), lists)]
+                step['actual'] = counter.reset()
+                step['step'] = 'fetch at the same time ' + ', '.join(
+                    f'{label} (~{size}, got {len(membership)})'
+                    for (label, size, _), membership in sorted(zip(lists, memberships), key=lambda pair: len(pair[1])))
+
+                memberships.sort(key=len)
+                names = [pokemon['name'] for pokemon in memberships[0]]
+                for membership in memberships[1:]:
+                    if not names:
+                        break
+                    membership_names: set[str] = {pokemon['name'] for pokemon in membership}
+                    names = [name for name in names if name in membership_names]
+                next(steps)['actual'] = 0
+                if self.pattern:
+                    names = [name for name in names if self._matches(name)]
+                    next(steps)['actual'] = 0
+            else:
+                first: list[dict[str, str]] = lists[0][2](api) or []
+                step['actual'] = counter.reset()
+                step['step'] += f', got {len(first)}'
+                names = [pokemon['name'] for pokemon in first]
+                if self.pattern:
+                    names = [name for name in names if self._matches(name)]
+                    next(steps)['actual'] = 0
+                for _, _, fetch in lists[1:]:
+                    step = next(steps)
+                    if not names:
+                        step['actual'] = 0
+                        step['step'] += ': skipped'
+                        continue
+                    membership_names = {pokemon['name'] for pokemon in fetch(api) or []}
+                    names = [name for name in names if name in membership_names]
+                    step['actual'] = counter.reset()
+
+            if 'count' in self.attributes:
+                self.count = len(names)
+                next(steps)['actual'] = 0
+            pokemons: DataFrame = DataFrame(names, columns=['name'], dtype=str)
+            details: list[str] = [attribute for attribute in self.attributes if attribute in self.DETAILS]
+            if details:
+                fetched: list[tuple[float, float]|None] = list(executor.map(
+                    lambda name: api.get_weight_height_pokemon(name=name), names))
+                next(steps)['actual'] = counter.reset()
+                for attribute in details:
+                    position: int = self.DETAILS.index(attribute)
+                    pokemons[attribute] = [detail[position] if detail else None for detail in fetched]
+        return pokemons
+
+    def explain(self) -> str:
+        """Describe the plan with the estimated and the actual number of
+
+        requests. The actual ones are only known after 'run'.
+
+        Returns
+        -------
+        str
+            The strategy chosen with its estimated cost, one line per
+            step and the totals.
+        """
+        steps: list[dict[str, Any]] = self.steps or self.plan()
+        strategy, together, one_by_one = self._strategy()
+        lines: list[str] = [
+            f'Lists fetched {strategy} (estimated cost: at the same time={together:.2f}, one by one={one_by_one:.2f})']
+        for number, step in enumerate(steps, start=1):
+            actual: str = '-' if step['actual'] is None else str(step['actual'])
+            lines.append(f"{number}. {step['step']}: estimated={step['estimated']} actual={actual}")
+
+        total_estimated: float = round(sum(step['estimated'] for step in steps), 2)
+        actuals: list[int|None] = [step['actual'] for step in steps]
+        total_actual: str = '-' if None in actuals else str(sum(actuals))  # type: ignore
+        lines.append(f'Total requests: estimated={total_estimated} actual={total_actual}')
+        return '\n'.join(lines)
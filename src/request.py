@@ -5,6 +5,7 @@ import requests
 from requests.exceptions import JSONDecodeError
 
 from pokemon import Pokemon
+from transport import Transport, RequestsTransport
 
 class RequestApi():
     """Model the general data and functionality to make a request.
@@ -13,6 +14,8 @@ class RequestApi():
     ----------
     base_url: str
         The base URL of the API.
+    transport: Transport
+        Who really sends the requests.
     
     Notes
     -----
@@ -20,23 +23,26 @@ class RequestApi():
     define any other.
     """
 
-    def __init__(self, base_url: str) -> None:
+    def __init__(self, base_url: str, transport: Transport|None = None) -> None:
         """Initialize the attributes.
         
         Parameters
         ----------
         base_url: str
             The base URL of the API. 
+        transport: Transport|None, optional
+            Who sends the requests. 'RequestsTransport' by default.
 
         Notes
         -----
         The base_url must to be finished in '/'.
         """
         self.base_url: str = base_url
+        self.transport: Transport = transport or RequestsTransport()
 
     def get(self, endpoint_url: str, **kwargs: int) -> requests.Response:
         """Get data from and specific endpoint."""
-        return requests.get(f'{self.base_url}{endpoint_url}', **kwargs)
+        return self.transport.get(f'{self.base_url}{endpoint_url}', **kwargs)
 
 
 class PokeApi(RequestApi):
@@ -57,13 +63,16 @@ class PokeApi(RequestApi):
     any other. Besides is a public API, so doesn't need authentication.
     """
 
-    def __init__(self, base_url: str= 'https://pokeapi.co/api/v2/', **kwargs: int) -> None:
+    def __init__(self, base_url: str= 'https://pokeapi.co/api/v2/', transport: Transport|None = None,
+                 **kwargs: int) -> None:
         """Initialize the attributes.
         
         Parameters
         ----------
         base_url: str, optional
             The base URL of the PokeAPI.
+        transport: Transport|None, optional
+            Who sends the requests. 'RequestsTransport' by default.
         kwargs: dict
             Other parameters to create a request.
 
@@ -71,19 +80,24 @@ class PokeApi(RequestApi):
         -----
         The base_url must to be finished in '/'.
         """
-        super().__init__(base_url)
+        super().__init__(base_url, transport)
         self.limit: int = kwargs.get('limit', 10)  # By default is 10
         
-    def get_all_pokemon(self) -> list[dict[str, str]]|None:
+    def get_all_pokemon(self, limit: int|None = None) -> list[dict[str, str]]|None:
         """Obtain -in only one request- the 'list' of all pokemon.
 
+        Parameters
+        ----------
+        limit: int|None, optional
+            Number of pokemons to get. The 'limit' attribute by default.
+
         Returns
         -------
         list[dict[str, str]]
             Contain the name of every pokemon registered.
         """
         endpoint_url: str = 'pokemon/'
-        params: dict[str, int] = {'limit': self.limit}
+        params: dict[str, int] = {'limit': limit or self.limit}
 
         response = self.get(endpoint_url, params=params)  # type: ignore
         if response.status_code == 200:
@@ -290,6 +304,45 @@ class PokeApi(RequestApi):
 
         return egg_group_species
 
+    def list_egg_groups(self) -> list[dict[str, str]]|None:
+        """Obtain -in only one request- the 'list' of all egg groups.
+
+        Returns
+        -------
+        list[dict[str, str]]
+            Contain the name and url of every egg group.
+        """
+        endpoint_url: str = 'egg-group/'
+
+        response = self.get(endpoint_url)
+        if response.status_code == 200:
+            json_response: dict[str, Any] = self.json_response(response, 'list_egg_groups')
+            return json_response['results']
+
+        print(f"Una disculpa. Ha ocurrido un error al intentar obtener la lista de los grupos de huevo.")
+
+    def get_egg_group_members(self, egg_group_name: str) -> list[dict[str, str]]|None:
+        """Get the species belonging to an egg group by its name.
+
+        Parameters
+        ----------
+        egg_group_name: str
+            Name of the egg group (in english, as the API gives it).
+
+        Returns
+        -------
+        list[dict[str, str]]
+            Contain the name and url of every species in the group.
+        """
+        endpoint_url: str = 'egg-group/'
+
+        response = self.get(f'{endpoint_url}{egg_group_name}/')
+        if response.status_code == 200:
+            json_response: dict[str, Any] = self.json_response(response, 'get_egg_group_members')
+            return json_response['pokemon_species']
+
+        print(f"Una disculpa. Ha ocurrido un error al intentar obtener el grupo de huevo '{egg_group_name}'.")
+
     def list_pokemon_by_type(self, type: str = '') -> dict[str, list]|None:
         """Retrieve in a list the name of all pokemons belonging to
         
@@ -358,3 +411,83 @@ class PokeApi(RequestApi):
             f"Una disculpa. Ha ocurrido un error al generar la lista de los pokémons de la "
             "generación '{generation_number}'.")
 
+
+    def list_pokemon_type_generation(self, type: str = '', generation_number: int = 1) -> list[Pokemon]|None:
+        """Get the pokemons of a type that belong to a generation,
+
+        with their weight and height.
+
+        Parameters
+        ----------
+        type: str, optional
+            Name of type to search its pokemons.
+        generation_number: int, optional
+            Number generation to cross with the type.
+
+        Returns
+        -------
+        list[Pokemon]
+            The instances of the pokemons in both lists.
+
+        Notes
+        -----
+        It makes 2 + 2N requests: the type, the generation and, for
+        each pokemon found in both, its species and its weight.
+        """
+        pokemon_type: dict[str, list]|None = self.list_pokemon_by_type(type)
+        pokemon_generation: dict[str, list]|None = self.list_pokemon_generation(generation_number)
+        if pokemon_type is None or pokemon_generation is None:
+            return None
+
+        generation_names: set[str] = {pokemon['name'] for pokemon in list(pokemon_generation.values())[0]}
+        pokemons: list[Pokemon] = []
+        for pokemon in list(pokemon_type.values())[0]:
+            if pokemon['name'] in generation_names:
+                pokemons.append(self.get_pokemon(name=pokemon['name']))  # type: ignore
+        return pokemons
+
+    def list_resources(self, endpoint_url: str, limit: int = 10000) -> list[dict[str, str]]|None:
+        """Obtain -in only one request- the 'list' of all resources of
+
+        an endpoint, like 'type/' or 'generation/'.
+
+        Parameters
+        ----------
+        endpoint_url: str
+            Endpoint of the resources. It must to be finished in '/'.
+        limit: int, optional
+            Maximum number of resources to get.
+
+        Returns
+        -------
+        list[dict[str, str]]
+            Contain the name and url of every resource.
+        """
+        response = self.get(endpoint_url, params={'limit': limit})  # type: ignore
+        if response.status_code == 200:
+            json_response: dict[str, Any] = self.json_response(response, 'list_resources')
+            return json_response['results']
+
+        print(f"Una disculpa. Ha ocurrido un error al intentar obtener la lista de '{endpoint_url}'.")
+
+    def get_names(self, endpoint_url: str, name: str) -> list[dict[str, Any]]|None:
+        """Get the names in every language of a resource.
+
+        Parameters
+        ----------
+        endpoint_url: str
+            Endpoint of the resource. It must to be finished in '/'.
+        name: str
+            Name or id of the resource.
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            The 'names' of the resource, each one with its language.
+        """
+        response = self.get(f'{endpoint_url}{name}/')
+        if response.status_code == 200:
+            json_response: dict[str, Any] = self.json_response(response, 'get_names')
+            return json_response['names']
+
+        print(f"Una disculpa. Ha ocurrido un error al intentar obtener los nombres de '{endpoint_url}{name}'.")
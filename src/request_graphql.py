@@ -0,0 +1,389 @@
+"""Alternate PokeAPI backend which uses its GraphQL endpoint."""
+from typing import Any
+
+import requests
+
+from pokemon import Pokemon
+from request import PokeApi
+from transport import Transport
+
+
+class PokeApiGraphQL(PokeApi):
+    """Request the PokeAPI data through GraphQL, so every question is
+    resolved with one batched query instead of several REST requests.
+
+    The methods return the same shapes that the ones of 'PokeApi'.
+
+    Attributes
+    ----------
+    base_url: str
+        The base URL of the REST API. Only used to build the 'url' of
+        the resources returned.
+    graphql_url: str
+        The URL of the GraphQL endpoint.
+    limit: int
+        Indicate the number of pokemons to get in 'get_all_pokemon'.
+
+    Notes
+    -----
+    The GraphQL endpoint only receives POST requests with the query and
+    its variables inside a JSON.
+
+    'get_pokemon' also gets the species of the egg groups of the
+    pokemon, so the next call to 'get_egg_group_species' with the same
+    pokemon doesn't make any request.
+    """
+
+    POKEMON_QUERY: str = """
+        query pokemon($where: pokemon_v2_pokemonspecies_bool_exp!) {
+          pokemon_v2_pokemonspecies(where: $where) {
+            id
+            name
+            pokemon_v2_pokemons(where: {is_default: {_eq: true}}) {
+              weight
+              height
+            }
+            pokemon_v2_pokemonegggroups {
+              pokemon_v2_egggroup {
+                id
+                name
+                pokemon_v2_egggroupnames(where: {pokemon_v2_language: {name: {_eq: "es"}}}) {
+                  name
+                }
+                pokemon_v2_pokemonegggroups {
+                  pokemon_v2_pokemonspecy {
+                    id
+                    name
+                  }
+                }
+              }
+            }
+          }
+        }"""
+
+    ALL_POKEMON_QUERY: str = """
+        query all_pokemon($limit: Int!) {
+          pokemon_v2_pokemon(limit: $limit, order_by: {id: asc}) {
+            id
+            name
+          }
+        }"""
+
+    TYPE_QUERY: str = """
+        query type($type: String!) {
+          pokemon_v2_type(where: {name: {_eq: $type}}) {
+            pokemon_v2_typenames(where: {pokemon_v2_language: {name: {_eq: "es"}}}) {
+              name
+            }
+            pokemon_v2_pokemontypes {
+              pokemon_v2_pokemon {
+                id
+                name
+              }
+            }
+          }
+        }"""
+
+    GENERATION_QUERY: str = """
+        query generation($generation: Int!) {
+          pokemon_v2_generation(where: {id: {_eq: $generation}}) {
+            pokemon_v2_generationnames(where: {pokemon_v2_language: {name: {_eq: "es"}}}) {
+              name
+            }
+            pokemon_v2_pokemonspecies {
+              id
+              name
+            }
+          }
+        }"""
+
+    TYPE_GENERATION_QUERY: str = """
+        query type_generation($type: String!, $generation: Int!) {
+          pokemon_v2_pokemonspecies(
+            where: {
+              generation_id: {_eq: $generation},
+              pokemon_v2_pokemons: {
+                is_default: {_eq: true},
+                pokemon_v2_pokemontypes: {pokemon_v2_type: {name: {_eq: $type}}}
+              }
+            },
+            order_by: {id: asc}
+          ) {
+            id
+            name
+            pokemon_v2_pokemons(where: {is_default: {_eq: true}}) {
+              weight
+              height
+            }
+            pokemon_v2_pokemonegggroups {
+              pokemon_v2_egggroup {
+                id
+                name
+              }
+            }
+          }
+        }"""
+
+    def __init__(self, base_url: str = 'https://pokeapi.co/api/v2/',
+                 graphql_url: str = 'https://beta.pokeapi.co/graphql/v1beta', transport: Transport|None = None,
+                 **kwargs: int) -> None:
+        """Initialize the attributes.
+
+        Parameters
+        ----------
+        base_url: str, optional
+            The base URL of the REST PokeAPI.
+        graphql_url: str, optional
+            The URL of the GraphQL endpoint.
+        transport: Transport|None, optional
+            Who sends the requests. 'RequestsTransport' by default.
+        kwargs: dict
+            Other parameters to create a request.
+        """
+        super().__init__(base_url, transport, **kwargs)
+        self.graphql_url: str = graphql_url
+        self._egg_group_species: dict[str, tuple[str, list[dict[str, str]]]] = {}
+
+    def query(self, query: str, variables: dict[str, Any], method_name: str) -> dict[str, Any]|None:
+        """Send a query to the GraphQL endpoint.
+
+        Parameters
+        ----------
+        query: str
+            The GraphQL query.
+        variables: dict[str, Any]
+            Values of the variables used inside the query.
+        method_name: str
+            Name of method where the query is sent.
+
+        Returns
+        -------
+        dict[str, Any]|None
+            The 'data' of the response. None if the request or the
+            query failed.
+        """
+        response: requests.Response = self.transport.post(
+            self.graphql_url, json={'query': query, 'variables': variables})
+        if response.status_code != 200:
+            return None
+
+        json_response: dict[str, Any] = self.json_response(response, method_name)
+        if json_response.get('errors'):
+            return None
+        return json_response['data']
+
+    def resource(self, endpoint_url: str, id: int, name: str) -> dict[str, str]:
+        """Build the same dict the REST API returns for a resource."""
+        return {'name': name, 'url': f'{self.base_url}{endpoint_url}{id}/'}
+
+    def get_all_pokemon(self, limit: int|None = None) -> list[dict[str, str]]|None:
+        """Obtain -in only one request- the 'list' of all pokemon.
+
+        Parameters
+        ----------
+        limit: int|None, optional
+            Number of pokemons to get. The 'limit' attribute by default.
+
+        Returns
+        -------
+        list[dict[str, str]]
+            Contain the name of every pokemon registered.
+        """
+        data: dict[str, Any]|None = self.query(
+            self.ALL_POKEMON_QUERY, {'limit': limit or self.limit}, 'get_all_pokemon')
+        if data is not None:
+            return [self.resource('pokemon/', pokemon['id'], pokemon['name'])
+                    for pokemon in data['pokemon_v2_pokemon']]
+
+        print(f"Una disculpa. Ha ocurrido un error al intentar obtener la lista de todos los pokémons.")
+
+    def to_pokemon(self, species: dict[str, Any]) -> Pokemon:
+        """Create a Pokemon from the species data of a query.
+
+        Parameters
+        ----------
+        species: dict[str, Any]
+            Species with its default pokemon and its egg groups.
+
+        Returns
+        -------
+        Pokemon
+            The instance of a pokemon with id, name, weight, height and
+            egg_groups.
+        """
+        egg_groups: list[dict[str, str]] = []
+        for species_egg_group in species['pokemon_v2_pokemonegggroups']:
+            egg_group: dict[str, Any] = species_egg_group['pokemon_v2_egggroup']
+            egg_groups.append(self.resource('egg-group/', egg_group['id'], egg_group['name']))
+
+            if 'pokemon_v2_pokemonegggroups' in egg_group:
+                names: list[dict[str, str]] = egg_group['pokemon_v2_egggroupnames']
+                egg_group_name: str = names[0]['name'] if names else egg_group['name']
+                species_list: list[dict[str, str]] = [
+                    self.resource('pokemon-species/', member['pokemon_v2_pokemonspecy']['id'],
+                                  member['pokemon_v2_pokemonspecy']['name'])
+                    for member in egg_group['pokemon_v2_pokemonegggroups']]
+                self._egg_group_species[egg_group['name']] = (egg_group_name, species_list)
+
+        default_pokemon: list[dict[str, int]] = species['pokemon_v2_pokemons']
+        weight: float = default_pokemon[0]['weight'] * 0.1 if default_pokemon else 0
+        height: float = default_pokemon[0]['height'] * 0.1 if default_pokemon else 0
+        return Pokemon(
+            id=species['id'],
+            name=species['name'],
+            weight=weight,
+            height=height,
+            egg_groups=egg_groups)
+
+    def get_pokemon(self, id: int = 0, name: str = '') -> Pokemon|None:
+        """Get the data of a pokemon data according its either id
+
+        or name, with only one request.
+
+        Parameters
+        ----------
+        id: int, optional
+            Pokemon's ID which is looking for.
+        name: str, optional
+            Pokemon's name which is looking for.
+
+        Returns
+        -------
+        pokemon: Pokemon
+            The instance of a pokemon with id, name, weight, height and
+            egg_groups.
+        """
+        if not id and not name:
+            raise AttributeError(f"A parameter 'id' or 'name' is required.")
+        elif id and name:
+            raise AttributeError(f"It was provided both parameters 'id' and a 'name'. Please just input one of them.")
+
+        where: dict[str, Any] = {'id': {'_eq': id}} if id else {'name': {'_eq': name}}
+        data: dict[str, Any]|None = self.query(self.POKEMON_QUERY, {'where': where}, 'get_pokemon')
+        if data is not None and data['pokemon_v2_pokemonspecies']:
+            return self.to_pokemon(data['pokemon_v2_pokemonspecies'][0])
+
+        if id:
+            print(f"Una disculpa. Ha ocurrido un error al intentar obtener el pokémon con id: {id}.")
+        else:
+            print(f"Una disculpa. Ha ocurrido un error al intentar obtener el pokémon con el nombre: {name}.")
+
+    def get_egg_group_species(self, pokemon: Pokemon)-> dict[str, list]|None:
+        """Get the species that belongs to the same egg group.
+
+        The egg groups already got by 'get_pokemon' don't make any
+        request, the rest are got with only one query.
+
+        Parameters
+        -----------
+        pokemon: Pokemon
+            The instance of a pokemon with id, name and egg_groups.
+
+        Returns
+        -------
+        egg_group_species: dict[str, list]
+            A dictionary where the keys are the egg groups' names and
+            the values are lists which contain the species belonging to
+            the egg group.
+        """
+        egg_group_species: dict[str, list] = {}
+        if any(egg_group['name'] not in self._egg_group_species for egg_group in pokemon.egg_groups):
+            if self.get_pokemon(id=pokemon.id) is None:
+                return None
+
+        for egg_group in pokemon.egg_groups:
+            egg_group_name, species_list = self._egg_group_species[egg_group['name']]
+            egg_group_species.setdefault(egg_group_name, species_list)
+        return egg_group_species
+
+    def list_pokemon_by_type(self, type: str = '') -> dict[str, list]|None:
+        """Retrieve in a list the name of all pokemons belonging to
+
+        the type.
+
+        Parameters
+        ----------
+        type: str, optional
+            Name of type to search its pokemons.
+
+        Returns
+        --------
+        pokemons_of_type: dict[str, list]
+            The key is the name of type -whether possible in spanish-
+            and the value is a list with the name of all pokemons of
+            the type.
+        """
+        if not type:
+            raise AttributeError(f"The 'type' parameter is required.")
+
+        data: dict[str, Any]|None = self.query(self.TYPE_QUERY, {'type': type}, 'list_pokemon_by_type')
+        if data is not None and data['pokemon_v2_type']:
+            type_data: dict[str, Any] = data['pokemon_v2_type'][0]
+            names: list[dict[str, str]] = type_data['pokemon_v2_typenames']
+            type_name: str = names[0]['name'] if names else type
+            pokemon_dict_list: list[dict[str, str]] = [
+                self.resource('pokemon/', pokemon['pokemon_v2_pokemon']['id'], pokemon['pokemon_v2_pokemon']['name'])
+                for pokemon in type_data['pokemon_v2_pokemontypes']]
+            return {type_name: pokemon_dict_list}
+
+        print(f"Una disculpa. Ha ocurrido un error al generar la lista de los pokémons de tipo '{type}'.")
+
+    def list_pokemon_generation(self, generation_number: int = 1) -> dict[str, list]|None:
+        """Generate a list with the names of each pokemon of that
+
+        specific generation.
+
+        Parameters
+        ----------
+        generation_number: int, optional
+            Number generation.
+
+        Returns
+        --------
+        pokemons_of_generation: dict[str, list]
+            The key is the name of generation, in spanish if possible,
+            and the value is the list with the names.
+        """
+        data: dict[str, Any]|None = self.query(
+            self.GENERATION_QUERY, {'generation': generation_number}, 'list_pokemon_generation')
+        if data is not None and data['pokemon_v2_generation']:
+            generation_data: dict[str, Any] = data['pokemon_v2_generation'][0]
+            names: list[dict[str, str]] = generation_data['pokemon_v2_generationnames']
+            generation_name: str|int = names[0]['name'] if names else generation_number
+            pokemon_list: list[dict[str, str]] = [
+                self.resource('pokemon-species/', species['id'], species['name'])
+                for species in generation_data['pokemon_v2_pokemonspecies']]
+            return {str(generation_name): pokemon_list}
+
+        print(
+            f"Una disculpa. Ha ocurrido un error al generar la lista de los pokémons de la "
+            f"generación '{generation_number}'.")
+
+    def list_pokemon_type_generation(self, type: str = '', generation_number: int = 1) -> list[Pokemon]|None:
+        """Get the pokemons of a type that belong to a generation,
+
+        with their weight and height, in only one request.
+
+        Parameters
+        ----------
+        type: str, optional
+            Name of type to search its pokemons.
+        generation_number: int, optional
+            Number generation to cross with the type.
+
+        Returns
+        -------
+        list[Pokemon]
+            The instances of the pokemons in both lists.
+        """
+        if not type:
+            raise AttributeError(f"The 'type' parameter is required.")
+
+        data: dict[str, Any]|None = self.query(
+            self.TYPE_GENERATION_QUERY, {'type': type, 'generation': generation_number}, 'list_pokemon_type_generation')
+        if data is not None:
+            return [self.to_pokemon(species) for species in data['pokemon_v2_pokemonspecies']]
+
+        print(
+            f"Una disculpa. Ha ocurrido un error al generar la lista de los pokémons de tipo '{type}' de la "
+            f"generación '{generation_number}'.")
@@ -0,0 +1,236 @@
+"""Transports which make the HTTP requests of 'RequestApi'."""
+import gzip
+import json
+from abc import ABC, abstractmethod
+from threading import Lock
+from time import sleep
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class Transport(ABC):
+    """Define how a request is sent and its response got.
+
+    Notes
+    -----
+    The subclasses only need to define 'request'.
+    """
+
+    @abstractmethod
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Send a request.
+
+        Parameters
+        ----------
+        method: str
+            HTTP method, as 'GET' or 'POST'.
+        url: str
+            Full URL of the endpoint.
+        kwargs: dict
+            Other parameters of the request, as 'params' or 'json'.
+
+        Returns
+        -------
+        requests.Response
+            The response of the request.
+        """
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        """Send a GET request."""
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        """Send a POST request."""
+        return self.request('POST', url, **kwargs)
+
+
+class RequestsTransport(Transport):
+    """Send every request with its own connection, through 'requests'."""
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Send a request with 'requests.request'."""
+        return requests.request(method, url, **kwargs)
+
+
+class PooledTransport(Transport):
+    """Reuse the connections between requests, so the TCP and TLS
+
+    handshakes are done once per host instead of once per request.
+
+    Attributes
+    ----------
+    session: requests.Session
+        The session which keeps the pool of connections.
+    """
+
+    def __init__(self, pool_maxsize: int = 10, max_retries: int = 2) -> None:
+        """Initialize the session.
+
+        Parameters
+        ----------
+        pool_maxsize: int, optional
+            Maximum number of connections kept per host. It should be
+            at least the number of threads making requests.
+        max_retries: int, optional
+            Number of retries of the failed connections.
+        """
+        adapter: HTTPAdapter = HTTPAdapter(pool_maxsize=pool_maxsize, max_retries=max_retries)
+        self.session: requests.Session = requests.Session()
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Send a request through the session."""
+        return self.session.request(method, url, **kwargs)
+
+
+class CountingTransport(Transport):
+    """Count the requests sent through other transport.
+
+    Attributes
+    ----------
+    transport: Transport
+        The transport which really sends the requests.
+    count: int
+        Number of requests sent since the creation or the last 'reset'.
+    """
+
+    def __init__(self, transport: Transport|None = None) -> None:
+        """Initialize the attributes.
+
+        Parameters
+        ----------
+        transport: Transport|None, optional
+            Transport to send the requests. 'RequestsTransport' by
+            default.
+        """
+        self.transport: Transport = transport or RequestsTransport()
+        self.count: int = 0
+        self._lock: Lock = Lock()
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Send a request and count it."""
+        with self._lock:
+            self.count += 1
+        return self.transport.request(method, url, **kwargs)
+
+    def reset(self) -> int:
+        """Set the count to 0 and return the previous one."""
+        with self._lock:
+            count, self.count = self.count, 0
+        return count
+
+
+def cassette_key(method: str, url: str, **kwargs: Any) -> str:
+    """Identify a request by its method, its full URL (with the query
+
+    parameters) and its body.
+
+    Only 'params', 'data' and 'json' are taken into account, the other
+    arguments (as 'timeout') don't change the response.
+
+    Returns
+    -------
+    str
+        The key of the request inside a cassette.
+    """
+    content: dict[str, Any] = {key: kwargs[key] for key in ('params', 'data', 'json') if key in kwargs}
+    prepared: requests.PreparedRequest = requests.Request(method, url, **content).prepare()
+    body: Any = prepared.body
+    if isinstance(body, bytes):
+        body = body.decode('utf-8')
+    return f'{method} {prepared.url}' + (f' {body}' if body else '')
+
+
+class RecordingTransport(Transport):
+    """Send the requests through other transport and keep their
+
+    responses to save them in a cassette file.
+
+    Attributes
+    ----------
+    transport: Transport
+        The transport which really sends the requests.
+    cassette_path: str
+        Path of the cassette file. It is a gzipped JSON.
+    """
+
+    def __init__(self, cassette_path: str, transport: Transport|None = None) -> None:
+        """Initialize the attributes.
+
+        Parameters
+        ----------
+        cassette_path: str
+            Path where the cassette will be saved.
+        transport: Transport|None, optional
+            Transport to send the requests. 'RequestsTransport' by
+            default.
+        """
+        self.cassette_path: str = cassette_path
+        self.transport: Transport = transport or RequestsTransport()
+        self._responses: dict[str, dict[str, Any]] = {}
+        self._lock: Lock = Lock()
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Send a request and keep its response."""
+        response: requests.Response = self.transport.request(method, url, **kwargs)
+        with self._lock:
+            self._responses[cassette_key(method, url, **kwargs)] = {
+                'status_code': response.status_code,
+                'body': response.text}
+        return response
+
+    def save(self) -> None:
+        """Write the responses kept in the cassette file."""
+        with self._lock:
+            content: str = json.dumps(self._responses, separators=(',', ':'))
+        with gzip.open(self.cassette_path, 'wt', encoding='utf-8') as cassette:
+            cassette.write(content)
+
+
+class ReplayTransport(Transport):
+    """Serve the responses of a cassette file without any connection.
+
+    Attributes
+    ----------
+    latency: float
+        Seconds to wait before every response, to simulate the network.
+    """
+
+    def __init__(self, cassette_path: str, latency: float = 0.0) -> None:
+        """Load the cassette.
+
+        Parameters
+        ----------
+        cassette_path: str
+            Path of the cassette file saved by 'RecordingTransport'.
+        latency: float, optional
+            Seconds to wait before every response. 0 by default.
+        """
+        with gzip.open(cassette_path, 'rt', encoding='utf-8') as cassette:
+            self._responses: dict[str, dict[str, Any]] = json.load(cassette)
+        self.latency: float = latency
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Build the response kept for the request.
+
+        Raises
+        ------
+        KeyError
+            If the request isn't in the cassette.
+        """
+        key: str = cassette_key(method, url, **kwargs)
+        if key not in self._responses:
+            raise KeyError(f"The request '{key}' isn't recorded in the cassette.")
+        if self.latency:
+            sleep(self.latency)
+
+        recorded: dict[str, Any] = self._responses[key]
+        response: requests.Response = requests.Response()
+        response.status_code = recorded['status_code']
+        response._content = recorded['body'].encode('utf-8')
+        response.encoding = 'utf-8'
+        response.url = url
+        return response
@@ -0,0 +1,50 @@
+"""Compare the REST and the GraphQL backends resolving the questions.
+
+It reports the number of requests and the wall time of each question.
+By default the stand-in PokeAPI answers with a simulated latency; with
+'--cassette' the responses of a cassette recorded from the real API are
+replayed instead (it must contain the requests of both backends).
+
+    > python tests/benchmark_backends.py --latency 0.05
+    > python tests/benchmark_backends.py --cassette pokeapi.json.gz
+"""
+import sys
+from argparse import ArgumentParser
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+import functions  # noqa: E402
+from fake_pokeapi import FakePokeApiTransport  # noqa: E402
+from request import PokeApi  # noqa: E402
+from request_graphql import PokeApiGraphQL  # noqa: E402
+from transport import CountingTransport, ReplayTransport, Transport  # noqa: E402
+
+QUESTIONS: dict[int, Callable[[PokeApi], Any]] = {
+    1: lambda api: functions.pokemon_match_patterns(api=api),
+    2: lambda api: functions.pokemon_egg_group_species(api=api)[1],
+    3: lambda api: functions.max_min_weigth_pokemon_by_type_generation(api=api),
+}
+
+
+def benchmark(transport: Transport) -> None:
+    """Print the requests and the time of every question and backend."""
+    print(f"{'question':<10}{'backend':<16}{'requests':>10}{'seconds':>10}  answer")
+    for number, question in QUESTIONS.items():
+        for backend in (PokeApi, PokeApiGraphQL):
+            counter: CountingTransport = CountingTransport(transport)
+            start: float = perf_counter()
+            answer: Any = question(backend(transport=counter))
+            seconds: float = perf_counter() - start
+            print(f'{number:<10}{backend.__name__:<16}{counter.count:>10}{seconds:>10.3f}  {answer}')
+
+
+if __name__ == '__main__':
+    parser: ArgumentParser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--latency', type=float, default=0.05, help='Seconds to wait in every request.')
+    parser.add_argument('--cassette', help='Cassette to replay instead of the stand-in PokeAPI.')
+    arguments = parser.parse_args()
+    benchmark(ReplayTransport(arguments.cassette, arguments.latency) if arguments.cassette
+              else FakePokeApiTransport(arguments.latency))
@@ -0,0 +1,9 @@
+"""Configuration of the tests.
+
+The modules inside 'src' import each other by their name, as when
+'main.py' is run, so the folder is added to the path.
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
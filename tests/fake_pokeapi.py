@@ -0,0 +1,276 @@
+"""Stand-in of the PokeAPI with a tiny dex, which answers offline.
+
+It answers the REST endpoints and the GraphQL queries of
+'PokeApiGraphQL'. The GraphQL responses only contain the fields selected
+by the query, and a field unknown by the stand-in is an error, so the
+queries and the code reading their responses are checked together.
+"""
+import json
+import re
+from time import sleep
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+import requests
+
+from transport import Transport
+
+BASE_URL: str = 'https://pokeapi.co/api/v2/'
+GRAPHQL_URL: str = 'https://beta.pokeapi.co/graphql/v1beta'
+
+# Default pokemon of every species: (id, name, species, weight, height,
+# types, generation, egg groups).
+DEX: list[tuple[int, str, str, int, int, list[str], int, list[str]]] = [
+    (25, 'pikachu', 'pikachu', 60, 4, ['electric'], 1, ['ground', 'fairy']),
+    (26, 'raichu', 'raichu', 300, 8, ['electric'], 1, ['ground', 'fairy']),
+    (35, 'clefairy', 'clefairy', 75, 6, ['fairy'], 1, ['fairy']),
+    (56, 'mankey', 'mankey', 280, 5, ['fighting'], 1, ['ground']),
+    (66, 'machop', 'machop', 195, 8, ['fighting'], 1, ['humanshape']),
+    (68, 'machamp', 'machamp', 1300, 16, ['fighting'], 1, ['humanshape']),
+    (107, 'hitmonchan', 'hitmonchan', 502, 14, ['fighting'], 1, ['humanshape']),
+    (132, 'ditto', 'ditto', 40, 3, ['normal'], 1, ['ditto']),
+    (150, 'mewtwo', 'mewtwo', 1220, 20, ['psychic'], 1, ['no-eggs']),
+    (448, 'lucario', 'lucario', 540, 12, ['fighting', 'steel'], 4, ['ground', 'humanshape']),
+    (641, 'tornadus-incarnate', 'tornadus', 630, 15, ['flying'], 5, ['no-eggs']),
+]
+
+# Names in other languages: {kind: {name: (id, {language: name})}}.
+NAMES: dict[str, dict[str, tuple[int, dict[str, str]]]] = {
+    'type': {
+        'normal': (1, {'es': 'Normal', 'fr': 'Normal'}),
+        'fighting': (2, {'es': 'Lucha', 'fr': 'Combat', 'ja-Hrkt': 'かくとう'}),
+        'flying': (3, {'es': 'Volador', 'fr': 'Vol'}),
+        'steel': (9, {'es': 'Acero', 'fr': 'Acier'}),
+        'electric': (13, {'es': 'Eléctrico', 'fr': 'Électrik'}),
+        'psychic': (14, {'es': 'Psíquico', 'fr': 'Psy'}),
+        'fairy': (18, {'es': 'Hada', 'fr': 'Fée'}),
+    },
+    'egg-group': {
+        'ground': (5, {'es': 'Campo', 'fr': 'Terrestre'}),
+        'fairy': (6, {'es': 'Hada', 'fr': 'Fée'}),
+        'humanshape': (8, {'es': 'Humanoide', 'fr': 'Humanoïde'}),
+        'ditto': (13, {'es': 'Ditto', 'fr': 'Métamorph'}),
+        'no-eggs': (15, {'es': 'Desconocido', 'fr': 'Inconnu'}),
+    },
+    'generation': {
+        'generation-i': (1, {'es': 'Generación I', 'fr': 'Génération I'}),
+        'generation-iv': (4, {'es': 'Generación IV', 'fr': 'Génération IV'}),
+        'generation-v': (5, {'es': 'Generación V', 'fr': 'Génération V'}),
+    },
+    'pokemon-species': {
+        species: (id, {'es': species.capitalize(), 'ja-Hrkt': species[::-1]})
+        for id, _, species, *_ in DEX},
+}
+NAMES['pokemon-species']['raichu'] = (26, {'es': 'Raichu', 'ja-Hrkt': 'ライチュウ'})
+
+
+class FakePokeApiTransport(Transport):
+    """Answer the requests to the REST and GraphQL PokeAPI with the
+
+    tiny dex.
+
+    Attributes
+    ----------
+    latency: float
+        Seconds to wait before every response, to simulate the network.
+    """
+
+    def __init__(self, latency: float = 0.0) -> None:
+        self.latency: float = latency
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        if self.latency:
+            sleep(self.latency)
+        if method == 'POST' and url == GRAPHQL_URL:
+            return response(200, graphql(kwargs['json']['query'], kwargs['json']['variables']))
+        parts = urlsplit(requests.Request(method, url, params=kwargs.get('params')).prepare().url)
+        query: dict[str, list[str]] = parse_qs(parts.query)
+        path: list[str] = parts.path.split('/api/v2/')[1].strip('/').split('/')
+        data: dict[str, Any]|None = self.rest(path, int(query.get('limit', ['20'])[0]))
+        return response(200, data) if data is not None else response(404, 'Not Found')
+
+    def rest(self, path: list[str], limit: int) -> dict[str, Any]|None:
+        """Build the JSON of a REST endpoint. None if it doesn't exist."""
+        kind: str = path[0]
+        if len(path) == 1:
+            if kind == 'pokemon':
+                return {'results': [resource('pokemon', id, name) for id, name, *_ in DEX][:limit]}
+            if kind in NAMES:
+                return {'results': [resource(kind, id, name) for name, (id, _) in NAMES[kind].items()][:limit]}
+            return None
+
+        key: str = path[1]
+        if kind == 'pokemon':
+            for id, name, _, weight, height, *_ in DEX:
+                if key in (str(id), name):
+                    return {'id': id, 'name': name, 'weight': weight, 'height': height}
+            return None
+
+        found: tuple[str, int]|None = find(kind, key)
+        if found is None:
+            return None
+        name, id = found
+        data: dict[str, Any] = {'id': id, 'name': name, 'names': names(kind, name)}
+        if kind == 'pokemon-species':
+            data['egg_groups'] = [resource('egg-group', NAMES['egg-group'][group][0], group)
+                                  for group in pokemon(name)[7]]
+        elif kind == 'type':
+            data['pokemon'] = [{'pokemon': resource('pokemon', row[0], row[1])} for row in DEX if name in row[5]]
+        elif kind == 'egg-group':
+            data['pokemon_species'] = [resource('pokemon-species', row[0], row[2]) for row in DEX if name in row[7]]
+        elif kind == 'generation':
+            data['pokemon_species'] = [resource('pokemon-species', row[0], row[2]) for row in DEX if row[6] == id]
+        return data
+
+
+def response(status_code: int, data: Any) -> requests.Response:
+    """Build a response with a JSON body."""
+    built: requests.Response = requests.Response()
+    built.status_code = status_code
+    built._content = json.dumps(data).encode('utf-8')
+    built.encoding = 'utf-8'
+    return built
+
+
+def resource(kind: str, id: int, name: str) -> dict[str, str]:
+    """Build the reference to a resource as the REST API does."""
+    return {'name': name, 'url': f'{BASE_URL}{kind}/{id}/'}
+
+
+def find(kind: str, key: str) -> tuple[str, int]|None:
+    """Find a resource of NAMES by its name or its id."""
+    for name, (id, _) in NAMES.get(kind, {}).items():
+        if key in (str(id), name):
+            return name, id
+    return None
+
+
+def names(kind: str, name: str) -> list[dict[str, Any]]:
+    """Build the 'names' in every language of a resource."""
+    return [{'name': local_name, 'language': {'name': language}}
+            for language, local_name in NAMES[kind][name][1].items()]
+
+
+def pokemon(species: str) -> tuple:
+    """Get the row of the dex of a species."""
+    return next(row for row in DEX if row[2] == species)
+
+
+def selection(query: str) -> tuple[list[str], dict[str, Any]]:
+    """Parse a GraphQL query.
+
+    Returns
+    -------
+    tuple[list[str], dict[str, Any]]
+        The names of the variables declared and the tree of fields
+        selected (None in the leaves). The arguments are ignored.
+    """
+    variables: list[str] = re.findall(r'\$(\w+)\s*:', query[:query.index('{')])
+    without_arguments: str = ''
+    depth: int = 0
+    for char in query:
+        depth += char == '('
+        if not depth:
+            without_arguments += char
+        depth -= char == ')'
+    tokens: list[str] = re.findall(r'[A-Za-z_]\w*|[{}]', without_arguments)
+    position: int = tokens.index('{') + 1
+
+    def block() -> dict[str, Any]:
+        nonlocal position
+        fields: dict[str, Any] = {}
+        while tokens[position] != '}':
+            name: str = tokens[position]
+            position += 1
+            fields[name] = None
+            if tokens[position] == '{':
+                position += 1
+                fields[name] = block()
+        position += 1
+        return fields
+
+    return variables, block()
+
+
+def prune(data: Any, fields: dict[str, Any]|None) -> Any:
+    """Keep only the fields selected.
+
+    Raises
+    ------
+    KeyError
+        If a field selected isn't in the stand-in data.
+    """
+    if fields is None:
+        return data
+    if isinstance(data, list):
+        return [prune(item, fields) for item in data]
+    missing: set[str] = set(fields) - set(data)
+    if missing:
+        raise KeyError(f"The fields {sorted(missing)} aren't in the stand-in schema.")
+    return {name: prune(data[name], subfields) for name, subfields in fields.items()}
+
+
+def spanish_name(kind: str, name: str) -> list[dict[str, str]]:
+    """Build the name in spanish as a GraphQL relation."""
+    return [{'name': NAMES[kind][name][1]['es']}]
+
+
+def egg_group_node(name: str) -> dict[str, Any]:
+    """Build an egg group as the GraphQL API does."""
+    return {
+        'id': NAMES['egg-group'][name][0],
+        'name': name,
+        'pokemon_v2_egggroupnames': spanish_name('egg-group', name),
+        'pokemon_v2_pokemonegggroups': [
+            {'pokemon_v2_pokemonspecy': {'id': row[0], 'name': row[2]}} for row in DEX if name in row[7]]}
+
+
+def species_node(row: tuple) -> dict[str, Any]:
+    """Build a species as the GraphQL API does."""
+    return {
+        'id': row[0],
+        'name': row[2],
+        'generation_id': row[6],
+        'pokemon_v2_pokemons': [{'weight': row[3], 'height': row[4]}],
+        'pokemon_v2_pokemonegggroups': [{'pokemon_v2_egggroup': egg_group_node(group)} for group in row[7]]}
+
+
+def graphql(query: str, variables: dict[str, Any]) -> dict[str, Any]:
+    """Answer the queries of 'PokeApiGraphQL'."""
+    declared, fields = selection(query)
+    if set(declared) != set(variables):
+        return {'errors': [{'message': f'Variables {sorted(variables)} given, {sorted(declared)} declared.'}]}
+
+    operation: str = re.findall(r'query\s+(\w+)', query)[0]
+    data: dict[str, Any]
+    if operation == 'all_pokemon':
+        data = {'pokemon_v2_pokemon': [{'id': row[0], 'name': row[1]} for row in DEX][:variables['limit']]}
+    elif operation == 'pokemon':
+        where: dict[str, Any] = variables['where']
+        key, value = ('id', where['id']['_eq']) if 'id' in where else ('name', where['name']['_eq'])
+        data = {'pokemon_v2_pokemonspecies': [
+            species_node(row) for row in DEX if (row[0] if key == 'id' else row[2]) == value]}
+    elif operation == 'type':
+        type: str = variables['type']
+        data = {'pokemon_v2_type': [{
+            'pokemon_v2_typenames': spanish_name('type', type),
+            'pokemon_v2_pokemontypes': [
+                {'pokemon_v2_pokemon': {'id': row[0], 'name': row[1]}} for row in DEX if type in row[5]]}
+            ] if type in NAMES['type'] else []}
+    elif operation == 'generation':
+        generation = next((name for name, (id, _) in NAMES['generation'].items() if id == variables['generation']), None)
+        data = {'pokemon_v2_generation': [{
+            'pokemon_v2_generationnames': spanish_name('generation', generation),
+            'pokemon_v2_pokemonspecies': [
+                {'id': row[0], 'name': row[2]} for row in DEX if row[6] == variables['generation']]}
+            ] if generation else []}
+    elif operation == 'type_generation':
+        data = {'pokemon_v2_pokemonspecies': [
+            species_node(row) for row in DEX if variables['type'] in row[5] and row[6] == variables['generation']]}
+    else:
+        return {'errors': [{'message': f"Unknown operation '{operation}'."}]}
+
+    try:
+        return {'data': prune(data, fields)}
+    except KeyError as key_error:
+        return {'errors': [{'message': str(key_error)}]}
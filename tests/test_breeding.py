@@ -0,0 +1,73 @@
+"""Tests of the breeding compatibility graph."""
+from breeding import BreedingGraph
+
+
+def small_graph() -> BreedingGraph:
+    """Build a graph with two linked groups, Ditto and a legendary."""
+    graph = BreedingGraph()
+    graph.add_species('pikachu', ['ground', 'fairy'])
+    graph.add_species('clefairy', ['fairy'])
+    graph.add_species('sandshrew', ['ground'])
+    graph.add_species('magnemite', ['mineral'])
+    graph.add_species('ditto', ['ditto'])
+    graph.add_species('mewtwo', ['no-eggs'])
+    return graph
+
+
+def test_shortest_chain_crosses_egg_groups() -> None:
+    graph = small_graph()
+    assert graph.shortest_chain('clefairy', 'sandshrew') == ['clefairy', 'pikachu', 'sandshrew']
+    assert graph.shortest_chain('clefairy', 'mewtwo') is None
+
+
+def test_chains_never_pass_through_ditto() -> None:
+    graph = small_graph()
+    assert graph.shortest_chain('clefairy', 'magnemite') is None
+    assert graph.shortest_chain('clefairy', 'ditto') is None
+    assert graph.reachable_species('ditto', 2) == set()
+
+
+def test_reachable_species_within_hops() -> None:
+    graph = small_graph()
+    assert graph.reachable_species('clefairy', 1) == {'pikachu'}
+    assert graph.reachable_species('clefairy', 2) == {'pikachu', 'sandshrew'}
+
+
+def test_ditto_breeds_with_every_breedable_species() -> None:
+    graph = small_graph()
+    assert graph.compatible_species('ditto') == {'pikachu', 'clefairy', 'sandshrew', 'magnemite'}
+    assert 'ditto' in graph.compatible_species('magnemite')
+    assert graph.compatible_species('mewtwo') == set()
+
+
+def test_connected_components() -> None:
+    graph = small_graph()
+    assert graph.connected_components() == [
+        {'pikachu', 'clefairy', 'sandshrew'}, {'magnemite'}, {'ditto'}, {'mewtwo'}]
+
+
+class CountingGraph(BreedingGraph):
+    """Count how many times every hub is expanded."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.expanded: dict[str, int] = {}
+
+    def _hub_members(self, hub_name: str) -> set[str]:
+        self.expanded[hub_name] = self.expanded.get(hub_name, 0) + 1
+        return super()._hub_members(hub_name)
+
+
+def test_every_hub_is_expanded_once_per_walk() -> None:
+    graph = CountingGraph()
+    for number in range(1100):
+        groups = [f'group-{number % 13}', f'group-{number % 7 + 13}'] if number % 50 else ['no-eggs']
+        graph.add_species(f'species-{number}', groups)
+    graph.add_species('ditto', ['ditto'])
+
+    assert graph.shortest_chain('species-1', 'species-1098') is not None
+    assert max(graph.expanded.values()) == 1
+    graph.expanded.clear()
+    graph.connected_components()
+    assert max(graph.expanded.values()) == 1
+    assert set(graph.expanded) == {f'group-{number}' for number in range(20)}
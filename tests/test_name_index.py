@@ -0,0 +1,76 @@
+"""Tests of the index of names, built from the stand-in PokeAPI."""
+from pathlib import Path
+
+import pytest
+
+import functions
+from fake_pokeapi import FakePokeApiTransport
+from name_index import NameIndex, normalize
+from query import Query
+from request import PokeApi
+from transport import CountingTransport
+
+
+@pytest.fixture(scope='module')
+def index() -> NameIndex:
+    return NameIndex.from_api(PokeApi(transport=FakePokeApiTransport()))
+
+
+def test_resolves_every_kind_in_every_language(index: NameIndex) -> None:
+    assert index.resolve('LÚCHA', 'type') == ('type', 2, 'fighting')
+    assert index.resolve('かくとう') == ('type', 2, 'fighting')
+    assert index.resolve('ライチュウ') == ('pokemon', 26, 'raichu')
+    assert index.resolve('26', 'pokemon') == ('pokemon', 26, 'raichu')
+    assert index.resolve('Humanoïde') == ('egg_group', 8, 'humanshape')
+    assert index.resolve('Generación I') == ('generation', 1, 'generation-i')
+    assert index.resolve('1', 'generation') == ('generation', 1, 'generation-i')
+
+
+def test_save_and_load(index: NameIndex, tmp_path: Path) -> None:
+    path: str = str(tmp_path / 'names.json.gz')
+    index.save(path)
+    assert NameIndex.load(path).resolve('Volador') == ('type', 3, 'flying')
+
+
+def test_japanese_marks_are_kept() -> None:
+    assert normalize('ガーディ') != normalize('カーディ')
+    assert normalize('Électrik') == 'electrik'
+
+
+def test_suggestions_of_a_kind_are_not_hidden_by_other_kinds() -> None:
+    index = NameIndex()
+    index.add('type', 9, 'steel', ['acero'])
+    for number in range(40):
+        index.add('pokemon', number, f'acerolo{number}')
+    assert index.suggest('acerolo', 'type') == [('type', 9, 'steel')]
+
+
+def test_questions_resolve_names_without_wasted_requests(index: NameIndex) -> None:
+    counter = CountingTransport(FakePokeApiTransport())
+    api = PokeApi(transport=counter)
+    assert functions.max_min_weigth_pokemon_by_type_generation('lucha', 'Generación I', api=api, index=index) == [
+        130.0, 19.5]
+    pokemon, species = functions.pokemon_egg_group_species('Raichu', api=api, index=index)
+    assert (pokemon.id, species) == (26, 5)
+
+    counter.reset()
+    assert functions.max_min_weigth_pokemon_by_type_generation('luhca', api=api, index=index) is None
+    assert functions.pokemon_egg_group_species('raichuu', api=api, index=index) is None
+    assert counter.count == 0
+
+
+def test_query_resolves_names(index: NameIndex) -> None:
+    query = Query(egg_group='Humanoide', generation='Generación I', index=index,  # type: ignore
+                  api=PokeApi(transport=FakePokeApiTransport()))
+    assert list(query.run()['name']) == ['machop', 'machamp', 'hitmonchan']
+    with pytest.raises(AttributeError):
+        Query(type='luhca', index=index)
+
+
+def test_names_written_by_the_user(index: NameIndex, monkeypatch: pytest.MonkeyPatch) -> None:
+    answers = iter(['Lucah', ''])
+    monkeypatch.setattr('builtins.input', lambda _: next(answers))
+    names = functions.get_names_user(3)
+    assert names == {'type': 'Lucah'}
+    api = PokeApi(transport=FakePokeApiTransport())
+    assert functions.max_min_weigth_pokemon_by_type_generation(api=api, index=index, **names) is None
@@ -0,0 +1,89 @@
+"""Tests of the prefetch backend against the stand-in PokeAPI."""
+from threading import Lock
+from time import perf_counter, sleep
+from typing import Any
+
+import requests
+
+import functions
+from fake_pokeapi import FakePokeApiTransport
+from prefetch import PrefetchPokeApi
+from transport import CountingTransport
+
+
+class LoggingTransport(CountingTransport):
+    """Count the requests and keep them, to find the repeated ones."""
+
+    def __init__(self, latency: float) -> None:
+        super().__init__(FakePokeApiTransport(latency))
+        self.sent: list[str] = []
+        self._log_lock: Lock = Lock()
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        with self._log_lock:
+            self.sent.append(f"{method} {url} {kwargs.get('params')}")
+        return super().request(method, url, **kwargs)
+
+
+def wait_for(condition: Any, timeout: float = 5.0) -> None:
+    """Wait until the condition is true, without a fixed sleep."""
+    start: float = perf_counter()
+    while not condition():
+        assert perf_counter() - start < timeout
+        sleep(0.001)
+
+
+def test_warm_up_and_questions_share_every_request() -> None:
+    transport = LoggingTransport(0.01)
+    api = PrefetchPokeApi(limit=898, transport=transport)
+    api.warm_up()
+    functions.pokemon_match_patterns(api=api)
+    functions.pokemon_egg_group_species(api=api)
+    functions.max_min_weigth_pokemon_by_type_generation(api=api)
+    api.cancel()
+
+    assert len(transport.sent) == len(set(transport.sent))
+    # The same requests as the questions without prefetch.
+    assert transport.count == 1 + 4 + 2 + 2 * 4
+
+
+def test_foreground_waits_for_the_request_in_flight() -> None:
+    transport = CountingTransport(FakePokeApiTransport(0.2))
+    api = PrefetchPokeApi(transport=transport)
+    api.prefetch(lambda: api.get_pokemon(26))
+    wait_for(lambda: transport.count == 1)
+
+    assert api.get_pokemon(26).name == 'raichu'  # type: ignore
+    # The species and the pokemon, both requested once.
+    assert transport.count == 2
+    api.cancel()
+
+
+def test_failed_requests_are_retried() -> None:
+    transport = CountingTransport(FakePokeApiTransport())
+    api = PrefetchPokeApi(transport=transport)
+    original, transport.transport = transport.transport, None  # type: ignore
+    api.prefetch(lambda: api.get_pokemon(26)).result()  # type: ignore
+    transport.transport = original
+
+    assert api.get_pokemon(26).name == 'raichu'  # type: ignore
+    # The failed species request is sent again, along with the pokemon.
+    assert transport.count == 1 + 2
+    api.cancel()
+
+
+def test_cancel_stops_the_background_requests() -> None:
+    transport = CountingTransport(FakePokeApiTransport(0.02))
+    api = PrefetchPokeApi(transport=transport)
+    ids: list[int] = [25, 26, 35, 56, 66, 68, 107, 132, 150, 448]
+    api.prefetch(lambda: [api.get_pokemon(id) for id in ids])
+    wait_for(lambda: transport.count >= 2)
+    api.cancel()
+    # A request which passed the check just before the cancellation is
+    # counted as soon as it is sent.
+    sleep(0.005)
+    sent: int = transport.count
+
+    sleep(0.2)
+    assert transport.count == sent < len(ids)
+    assert api.prefetch(lambda: api.get_pokemon(25)) is None
@@ -0,0 +1,64 @@
+"""Tests of the query planner against the stand-in PokeAPI."""
+from fake_pokeapi import FakePokeApiTransport
+from prefetch import PrefetchPokeApi
+from query import Query
+from request import PokeApi
+from request_graphql import PokeApiGraphQL
+
+
+def test_filters_and_counts_requests() -> None:
+    query = Query(type='fighting', generation=1, pattern='an', attributes=('weight',),
+                  api=PokeApi(transport=FakePokeApiTransport()))
+    pokemons = query.run()
+    assert list(pokemons['name']) == ['mankey', 'hitmonchan']
+    assert list(pokemons['weight']) == [28.0, 50.2]
+    assert [step['actual'] for step in query.steps] == [2, 0, 0, 2]
+    assert 'Total requests: estimated=' in query.explain() and 'actual=4' in query.explain()
+
+
+def test_pattern_only_lists_every_pokemon() -> None:
+    pokemons = Query(pattern='at', api=PokeApi(transport=FakePokeApiTransport())).run()
+    assert list(pokemons['name']) == ['tornadus-incarnate']
+
+
+def test_estimates_depend_on_the_value() -> None:
+    assert Query(type='ice', attributes=('weight',)).plan()[-1]['estimated'] == 55
+    assert Query(generation=1, attributes=('weight',)).plan()[-1]['estimated'] == 151
+    assert "fetch at the same time type 'ice' (~55), generation 1 (~151)" in Query(type='ice', generation=1).explain()
+
+
+def test_lists_are_fetched_one_by_one_when_few_candidates_are_expected() -> None:
+    query = Query(egg_group='ditto', type='normal', pattern='zz', api=PokeApi(transport=FakePokeApiTransport()))
+    assert query.run().empty
+    assert [step['actual'] for step in query.steps] == [1, 0, 0]
+    assert query.explain().startswith('Lists fetched one by one')
+    assert 'skipped' in query.steps[-1]['step']
+
+    query = Query(egg_group='ditto', type='normal', pattern='dit', api=PokeApi(transport=FakePokeApiTransport()))
+    assert list(query.run()['name']) == ['ditto']
+    assert [step['actual'] for step in query.steps] == [1, 0, 1]
+
+
+def test_count_needs_no_extra_requests() -> None:
+    query = Query(type='fighting', generation=1, attributes=('count',), api=PokeApi(transport=FakePokeApiTransport()))
+    query.run()
+    assert query.count == 4
+    assert query.explain().startswith('Lists fetched together')
+    assert 'actual=2' in query.explain().splitlines()[-1]
+
+
+def test_counts_graphql_requests() -> None:
+    query = Query(type='fighting', generation=1, api=PokeApiGraphQL(transport=FakePokeApiTransport()))
+    query.run()
+    assert query.steps[0]['actual'] == 2
+
+
+def test_cached_responses_are_not_counted() -> None:
+    api = PrefetchPokeApi(transport=FakePokeApiTransport())
+    first, second = Query(type='fighting', api=api), Query(type='fighting', api=api)
+    first.run()
+    second.run()
+    assert first.steps[0]['actual'] == 1
+    assert second.steps[0]['actual'] == 0
+    assert 'get' not in vars(api)
+    api.cancel()
@@ -0,0 +1,61 @@
+"""Tests of the GraphQL backend against the stand-in PokeAPI."""
+import pytest
+
+import functions
+from fake_pokeapi import FakePokeApiTransport, graphql
+from request import PokeApi
+from request_graphql import PokeApiGraphQL
+from transport import CountingTransport
+
+
+@pytest.fixture
+def rest() -> PokeApi:
+    return PokeApi(transport=CountingTransport(FakePokeApiTransport()))
+
+
+@pytest.fixture
+def gql() -> PokeApiGraphQL:
+    return PokeApiGraphQL(transport=CountingTransport(FakePokeApiTransport()))
+
+
+def as_tuple(pokemon) -> tuple:
+    return (pokemon.id, pokemon.name, pokemon.weight, pokemon.height, pokemon.egg_groups)
+
+
+@pytest.mark.parametrize('query', [
+    PokeApiGraphQL.POKEMON_QUERY, PokeApiGraphQL.ALL_POKEMON_QUERY, PokeApiGraphQL.TYPE_QUERY,
+    PokeApiGraphQL.GENERATION_QUERY, PokeApiGraphQL.TYPE_GENERATION_QUERY])
+def test_queries_select_known_fields(query: str) -> None:
+    variables = {'pokemon': {'where': {'id': {'_eq': 26}}}, 'all_pokemon': {'limit': 5}, 'type': {'type': 'fighting'},
+                 'generation': {'generation': 1}, 'type_generation': {'type': 'fighting', 'generation': 1}}
+    operation = query.split()[1].split('(')[0]
+    assert 'errors' not in graphql(query, variables[operation])
+
+
+def test_same_shapes_as_rest(rest: PokeApi, gql: PokeApiGraphQL) -> None:
+    assert gql.get_all_pokemon(limit=898) == rest.get_all_pokemon(limit=898)
+    assert as_tuple(gql.get_pokemon(26)) == as_tuple(rest.get_pokemon(26))
+    assert as_tuple(gql.get_pokemon(name='raichu')) == as_tuple(rest.get_pokemon(name='raichu'))
+    assert functions.pokemon_egg_group_species('raichu', api=gql)[1] == 5  # type: ignore
+    raichu = rest.get_pokemon(26)
+    assert gql.get_egg_group_species(raichu) == rest.get_egg_group_species(raichu)
+    assert gql.list_pokemon_by_type('fighting') == rest.list_pokemon_by_type('fighting')
+    assert gql.list_pokemon_generation(1) == rest.list_pokemon_generation(1)
+    assert ([as_tuple(pokemon) for pokemon in gql.list_pokemon_type_generation('fighting', 1)]
+            == [as_tuple(pokemon) for pokemon in rest.list_pokemon_type_generation('fighting', 1)])
+
+
+def test_same_answers_with_one_request_per_question(rest: PokeApi, gql: PokeApiGraphQL) -> None:
+    questions = [
+        lambda api: functions.pokemon_match_patterns(api=api),
+        lambda api: functions.pokemon_egg_group_species(api=api)[1],
+        lambda api: functions.max_min_weigth_pokemon_by_type_generation(api=api)]
+    for question in questions:
+        assert question(gql) == question(rest)
+        assert gql.transport.reset() == 1  # type: ignore
+        rest.transport.reset()  # type: ignore
+
+
+def test_unknown_pokemon_returns_none(gql: PokeApiGraphQL) -> None:
+    assert gql.get_pokemon(name='missingno') is None
+    assert gql.list_pokemon_by_type('shadow') is None
@@ -0,0 +1,52 @@
+"""Tests of the transports, recording and replaying the questions."""
+from pathlib import Path
+
+import pytest
+
+import functions
+from fake_pokeapi import FakePokeApiTransport
+from request import PokeApi
+from transport import CountingTransport, RecordingTransport, ReplayTransport, Transport
+
+
+def ask_questions(transport: Transport) -> tuple:
+    """Resolve the three questions of the menu through a transport."""
+    api: PokeApi = PokeApi(transport=transport)
+    pokemon, species = functions.pokemon_egg_group_species(api=api)
+    return (functions.pokemon_match_patterns(api=api), pokemon.name, species,
+            functions.max_min_weigth_pokemon_by_type_generation(api=api))
+
+
+def test_transport_is_abstract() -> None:
+    with pytest.raises(TypeError):
+        Transport()  # type: ignore
+
+
+def test_counting_transport() -> None:
+    counter = CountingTransport(FakePokeApiTransport())
+    ask_questions(counter)
+    # 1 list + (2 species and pokemon + 2 egg groups) + (type, generation and 2 per fighting pokemon).
+    assert counter.reset() == 1 + 4 + 2 + 2 * 4
+    assert counter.count == 0
+
+
+def test_replay_answers_every_question_offline(tmp_path: Path) -> None:
+    cassette: str = str(tmp_path / 'pokeapi.json.gz')
+    recorder = RecordingTransport(cassette, FakePokeApiTransport())
+    answers: tuple = ask_questions(recorder)
+    recorder.save()
+
+    assert ask_questions(ReplayTransport(cassette)) == answers
+    assert answers == (2, 'raichu', 5, [130.0, 19.5])
+
+
+def test_cassette_ignores_arguments_without_effect_in_response(tmp_path: Path) -> None:
+    cassette: str = str(tmp_path / 'pokeapi.json.gz')
+    recorder = RecordingTransport(cassette, FakePokeApiTransport())
+    recorder.get('https://pokeapi.co/api/v2/type/fighting/', timeout=5)
+    recorder.save()
+
+    replayed = ReplayTransport(cassette).get('https://pokeapi.co/api/v2/type/fighting/', timeout=1, verify=True)
+    assert replayed.status_code == 200
+    with pytest.raises(KeyError):
+        ReplayTransport(cassette).get('https://pokeapi.co/api/v2/type/fire/')